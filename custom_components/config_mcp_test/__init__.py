@@ -11,6 +11,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from homeassistant.components.http import HomeAssistantView
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
@@ -54,6 +55,8 @@ from .const import (
     CONF_SCRIPTS_READ,
     CONF_SCRIPTS_UPDATE,
     DATA_DASHBOARDS_COLLECTION,
+    DATA_HELPER_DATA,
+    DATA_INTEGRATION_NAMES,
     DEFAULT_OPTIONS,
     DOMAIN,
     RESOURCE_AREAS,
@@ -110,6 +113,10 @@ from .views import (
     ServiceDetailView,
     ServiceListView,
 )
+from .registry_cache import async_setup_registry_caches
+from .views.areas import AREA_AGGREGATES
+from .views.devices import DEVICE_INDEX, ENTITY_COUNTS
+from .views.helpers import async_listen_final_write, flush_pending
 from .mcp_http import MCPOAuthMetadataView, MCPStreamableView
 
 _LOGGER = logging.getLogger(__name__)
@@ -117,6 +124,91 @@ _LOGGER = logging.getLogger(__name__)
 # Track registered views to avoid duplicate registration
 _REGISTERED_VIEWS: set[str] = set()
 
+# View groups registered per resource: (resource, option keys of which any
+# enables the group, view classes, description for the log message)
+_VIEW_GROUPS: tuple[
+    tuple[str, tuple[str, ...], tuple[type[HomeAssistantView], ...], str], ...
+] = (
+    (
+        RESOURCE_DASHBOARDS,
+        (CONF_DASHBOARDS_READ, CONF_DASHBOARDS_CREATE, CONF_DASHBOARDS_UPDATE, CONF_DASHBOARDS_DELETE),
+        (DashboardListView, DashboardDetailView, DashboardConfigView, ResourceListView),
+        "dashboard API endpoints at /api/config_mcp/dashboards and /api/config_mcp/resources",
+    ),
+    (
+        RESOURCE_ENTITIES,
+        (CONF_DISCOVERY_ENTITIES,),
+        (EntityListView, EntityDetailView, DomainListView, DomainEntitiesView, EntityUsageView),
+        "entity discovery API endpoints at /api/config_mcp/entities",
+    ),
+    (
+        RESOURCE_DEVICES,
+        (CONF_DISCOVERY_DEVICES,),
+        (DeviceListView, DeviceDetailView),
+        "device discovery API endpoints at /api/config_mcp/devices",
+    ),
+    (
+        RESOURCE_AREAS,
+        (CONF_DISCOVERY_AREAS,),
+        (AreaListView, AreaDetailView, FloorListView, FloorDetailView),
+        "area/floor discovery API endpoints at /api/config_mcp/areas and /api/config_mcp/floors",
+    ),
+    (
+        RESOURCE_INTEGRATIONS,
+        (CONF_DISCOVERY_INTEGRATIONS,),
+        (IntegrationListView, IntegrationDetailView),
+        "integration discovery API endpoints at /api/config_mcp/integrations",
+    ),
+    (
+        RESOURCE_SERVICES,
+        (CONF_DISCOVERY_SERVICES,),
+        (ServiceListView, DomainServiceListView, ServiceDetailView),
+        "service discovery API endpoints at /api/config_mcp/services",
+    ),
+    (
+        RESOURCE_AUTOMATIONS,
+        (CONF_AUTOMATIONS_READ, CONF_AUTOMATIONS_CREATE, CONF_AUTOMATIONS_UPDATE, CONF_AUTOMATIONS_DELETE),
+        (AutomationListView, AutomationDetailView, AutomationTriggerView),
+        "automation API endpoints at /api/config_mcp/automations",
+    ),
+    (
+        RESOURCE_SCRIPTS,
+        (CONF_SCRIPTS_READ, CONF_SCRIPTS_CREATE, CONF_SCRIPTS_UPDATE, CONF_SCRIPTS_DELETE),
+        (ScriptListView, ScriptDetailView, ScriptRunView, ScriptStopView),
+        "script API endpoints at /api/config_mcp/scripts",
+    ),
+    (
+        RESOURCE_SCENES,
+        (CONF_SCENES_READ, CONF_SCENES_CREATE, CONF_SCENES_UPDATE, CONF_SCENES_DELETE),
+        (SceneListView, SceneDetailView, SceneActivateView),
+        "scene API endpoints at /api/config_mcp/scenes",
+    ),
+    (
+        RESOURCE_LOGS,
+        (CONF_LOGS_READ,),
+        (LogListView, LogErrorsView),
+        "log API endpoints at /api/config_mcp/logs",
+    ),
+    (
+        RESOURCE_CATEGORIES,
+        (CONF_CATEGORIES_READ, CONF_CATEGORIES_CREATE, CONF_CATEGORIES_UPDATE, CONF_CATEGORIES_DELETE),
+        (CategoryScopeListView, CategoryDetailView),
+        "category API endpoints at /api/config_mcp/categories",
+    ),
+    (
+        RESOURCE_LABELS,
+        (CONF_LABELS_READ, CONF_LABELS_CREATE, CONF_LABELS_UPDATE, CONF_LABELS_DELETE),
+        (LabelListView, LabelDetailView),
+        "label API endpoints at /api/config_mcp/labels",
+    ),
+    (
+        RESOURCE_HELPERS,
+        (CONF_HELPERS_READ, CONF_HELPERS_CREATE, CONF_HELPERS_UPDATE, CONF_HELPERS_DELETE),
+        (HelperListView, HelperDetailView),
+        "helper API endpoints at /api/config_mcp/helpers",
+    ),
+)
+
 
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Migrate old config entry to new version.
@@ -133,7 +225,7 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     if config_entry.version == 1:
         # Migrate from version 1 (legacy format) to version 2 (granular options)
         old_options = dict(config_entry.options)
-        new_options = DEFAULT_OPTIONS.copy()
+        new_options = dict(DEFAULT_OPTIONS)
 
         # Check for legacy format
         if CONF_ENABLED_RESOURCES in old_options:
@@ -164,7 +256,7 @@ def _get_options(entry: ConfigEntry) -> dict[str, Any]:
     options = dict(entry.options)
 
     # Start with defaults, then override with stored options
-    merged = DEFAULT_OPTIONS.copy()
+    merged = dict(DEFAULT_OPTIONS)
 
     # If already in new granular format (has create/update/delete keys), merge
     if CONF_DASHBOARDS_CREATE in options:
@@ -214,25 +306,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     _LOGGER.info("Configuration MCP Server setting up with options: %s", options)
 
-    # Initialize DashboardsCollection if any dashboard permission is enabled
-    dashboards_enabled = (
-        options.get(CONF_DASHBOARDS_READ) or
-        options.get(CONF_DASHBOARDS_CREATE) or
-        options.get(CONF_DASHBOARDS_UPDATE) or
-        options.get(CONF_DASHBOARDS_DELETE)
+    # Cache registry aggregates for the discovery views; removed on unload
+    async_setup_registry_caches(
+        hass, entry, (AREA_AGGREGATES, DEVICE_INDEX, ENTITY_COUNTS)
     )
-    if dashboards_enabled:
+
+    # Write helper changes still waiting on their delay when HA shuts down
+    entry.async_on_unload(async_listen_final_write(hass))
+
+    # Resolve the enabled view groups once for the checks below
+    enabled_groups = _enabled_view_groups(options)
+
+    # Initialize DashboardsCollection if any dashboard permission is enabled
+    if RESOURCE_DASHBOARDS in enabled_groups:
         await _setup_dashboards_collection(hass)
 
     # Pre-register MCP tools in executor to avoid blocking event loop
     # This must happen before _register_views so tools are ready when MCP server starts
-    if options.get(CONF_MCP_SERVER):
+    if "mcp_server" in enabled_groups:
         from .tools import register_all_tools
         tool_count = await hass.async_add_executor_job(register_all_tools)
         _LOGGER.info("Pre-registered %d MCP tools at startup", tool_count)
 
     # Register views for enabled resources
-    _register_views(hass, options)
+    _register_views(hass, options, enabled_groups)
 
     # Listen for options updates
     entry.async_on_unload(entry.add_update_listener(_async_update_options))
@@ -258,6 +355,13 @@ async def _setup_dashboards_collection(hass: HomeAssistant) -> None:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    # Write out helper changes and run reloads still waiting on their delay
+    await flush_pending(hass)
+    # Drop cached helper data so a reload picks up edits made outside this integration
+    hass.data.pop(DATA_HELPER_DATA, None)
+    # Resolve integration names afresh after a reload
+    hass.data.pop(DATA_INTEGRATION_NAMES, None)
+
     if DOMAIN in hass.data and entry.entry_id in hass.data[DOMAIN]:
         del hass.data[DOMAIN][entry.entry_id]
 
@@ -283,74 +387,56 @@ async def _async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None
     )
 
 
-def _register_views(hass: HomeAssistant, options: dict[str, Any]) -> None:
+def _enabled_view_groups(options: dict[str, Any]) -> set[str]:
+    """Get the view groups that the options enable.
+
+    Args:
+        options: Configuration options dict
+
+    Returns:
+        Names of the enabled view groups, including "mcp_server"
+    """
+    enabled = {
+        resource
+        for resource, option_keys, _, _ in _VIEW_GROUPS
+        if any(options.get(key) for key in option_keys)
+    }
+    if options.get(CONF_MCP_SERVER):
+        enabled.add("mcp_server")
+    return enabled
+
+
+def _register_views(
+    hass: HomeAssistant,
+    options: dict[str, Any],
+    enabled_groups: set[str] | None = None,
+) -> None:
     """Register HTTP views for enabled resources.
 
+    Views cannot be unregistered, so only groups that are enabled and not
+    yet registered are handled; when there are none this returns at once.
+
     Args:
         hass: Home Assistant instance
         options: Configuration options dict
+        enabled_groups: The groups enabled by options, if already resolved
     """
-    global _REGISTERED_VIEWS
-
-    # Dashboard views (if any dashboard permission is enabled)
-    dashboards_enabled = (
-        options.get(CONF_DASHBOARDS_READ) or
-        options.get(CONF_DASHBOARDS_CREATE) or
-        options.get(CONF_DASHBOARDS_UPDATE) or
-        options.get(CONF_DASHBOARDS_DELETE)
-    )
-    if dashboards_enabled and RESOURCE_DASHBOARDS not in _REGISTERED_VIEWS:
-        hass.http.register_view(DashboardListView())
-        hass.http.register_view(DashboardDetailView())
-        hass.http.register_view(DashboardConfigView())
-        hass.http.register_view(ResourceListView())
-        _REGISTERED_VIEWS.add(RESOURCE_DASHBOARDS)
-        _LOGGER.info("Registered dashboard API endpoints at /api/config_mcp/dashboards")
-        _LOGGER.info("Registered resources API endpoint at /api/config_mcp/resources")
-
-    # Entity discovery views
-    if options.get(CONF_DISCOVERY_ENTITIES) and RESOURCE_ENTITIES not in _REGISTERED_VIEWS:
-        hass.http.register_view(EntityListView())
-        hass.http.register_view(EntityDetailView())
-        hass.http.register_view(DomainListView())
-        hass.http.register_view(DomainEntitiesView())
-        hass.http.register_view(EntityUsageView())
-        _REGISTERED_VIEWS.add(RESOURCE_ENTITIES)
-        _LOGGER.info("Registered entity discovery API endpoints at /api/config_mcp/entities")
-
-    # Device discovery views
-    if options.get(CONF_DISCOVERY_DEVICES) and RESOURCE_DEVICES not in _REGISTERED_VIEWS:
-        hass.http.register_view(DeviceListView())
-        hass.http.register_view(DeviceDetailView())
-        _REGISTERED_VIEWS.add(RESOURCE_DEVICES)
-        _LOGGER.info("Registered device discovery API endpoints at /api/config_mcp/devices")
-
-    # Area/Floor discovery views
-    if options.get(CONF_DISCOVERY_AREAS) and RESOURCE_AREAS not in _REGISTERED_VIEWS:
-        hass.http.register_view(AreaListView())
-        hass.http.register_view(AreaDetailView())
-        hass.http.register_view(FloorListView())
-        hass.http.register_view(FloorDetailView())
-        _REGISTERED_VIEWS.add(RESOURCE_AREAS)
-        _LOGGER.info("Registered area/floor discovery API endpoints at /api/config_mcp/areas and /api/config_mcp/floors")
-
-    # Integration discovery views
-    if options.get(CONF_DISCOVERY_INTEGRATIONS) and RESOURCE_INTEGRATIONS not in _REGISTERED_VIEWS:
-        hass.http.register_view(IntegrationListView())
-        hass.http.register_view(IntegrationDetailView())
-        _REGISTERED_VIEWS.add(RESOURCE_INTEGRATIONS)
-        _LOGGER.info("Registered integration discovery API endpoints at /api/config_mcp/integrations")
-
-    # Service discovery views
-    if options.get(CONF_DISCOVERY_SERVICES) and RESOURCE_SERVICES not in _REGISTERED_VIEWS:
-        hass.http.register_view(ServiceListView())
-        hass.http.register_view(DomainServiceListView())
-        hass.http.register_view(ServiceDetailView())
-        _REGISTERED_VIEWS.add(RESOURCE_SERVICES)
-        _LOGGER.info("Registered service discovery API endpoints at /api/config_mcp/services")
+    if enabled_groups is None:
+        enabled_groups = _enabled_view_groups(options)
+    new_groups = enabled_groups - _REGISTERED_VIEWS
+    if not new_groups:
+        return
+
+    for resource, _, view_classes, description in _VIEW_GROUPS:
+        if resource not in new_groups:
+            continue
+        for view_class in view_classes:
+            hass.http.register_view(view_class())
+        _REGISTERED_VIEWS.add(resource)
+        _LOGGER.info("Registered %s", description)
 
     # MCP Server
-    if options.get(CONF_MCP_SERVER) and "mcp_server" not in _REGISTERED_VIEWS:
+    if "mcp_server" in new_groups:
         oauth_enabled = options.get(CONF_MCP_OAUTH_ENABLED, False)
         hass.http.register_view(MCPStreamableView(hass, oauth_enabled=oauth_enabled))
         _REGISTERED_VIEWS.add("mcp_server")
@@ -411,92 +497,3 @@ def _register_views(hass: HomeAssistant, options: dict[str, Any]) -> None:
             # Clear the restart required repair since OAuth is now active
             from homeassistant.helpers import issue_registry as ir
             ir.async_delete_issue(hass, DOMAIN, "oauth_restart_required")
-
-    # Automation views (if any automation permission is enabled)
-    automations_enabled = (
-        options.get(CONF_AUTOMATIONS_READ) or
-        options.get(CONF_AUTOMATIONS_CREATE) or
-        options.get(CONF_AUTOMATIONS_UPDATE) or
-        options.get(CONF_AUTOMATIONS_DELETE)
-    )
-    if automations_enabled and RESOURCE_AUTOMATIONS not in _REGISTERED_VIEWS:
-        hass.http.register_view(AutomationListView())
-        hass.http.register_view(AutomationDetailView())
-        hass.http.register_view(AutomationTriggerView())
-        _REGISTERED_VIEWS.add(RESOURCE_AUTOMATIONS)
-        _LOGGER.info("Registered automation API endpoints at /api/config_mcp/automations")
-
-    # Script views (if any script permission is enabled)
-    scripts_enabled = (
-        options.get(CONF_SCRIPTS_READ) or
-        options.get(CONF_SCRIPTS_CREATE) or
-        options.get(CONF_SCRIPTS_UPDATE) or
-        options.get(CONF_SCRIPTS_DELETE)
-    )
-    if scripts_enabled and RESOURCE_SCRIPTS not in _REGISTERED_VIEWS:
-        hass.http.register_view(ScriptListView())
-        hass.http.register_view(ScriptDetailView())
-        hass.http.register_view(ScriptRunView())
-        hass.http.register_view(ScriptStopView())
-        _REGISTERED_VIEWS.add(RESOURCE_SCRIPTS)
-        _LOGGER.info("Registered script API endpoints at /api/config_mcp/scripts")
-
-    # Scene views (if any scene permission is enabled)
-    scenes_enabled = (
-        options.get(CONF_SCENES_READ) or
-        options.get(CONF_SCENES_CREATE) or
-        options.get(CONF_SCENES_UPDATE) or
-        options.get(CONF_SCENES_DELETE)
-    )
-    if scenes_enabled and RESOURCE_SCENES not in _REGISTERED_VIEWS:
-        hass.http.register_view(SceneListView())
-        hass.http.register_view(SceneDetailView())
-        hass.http.register_view(SceneActivateView())
-        _REGISTERED_VIEWS.add(RESOURCE_SCENES)
-        _LOGGER.info("Registered scene API endpoints at /api/config_mcp/scenes")
-
-    # Log views (if log reading is enabled)
-    if options.get(CONF_LOGS_READ) and RESOURCE_LOGS not in _REGISTERED_VIEWS:
-        hass.http.register_view(LogListView())
-        hass.http.register_view(LogErrorsView())
-        _REGISTERED_VIEWS.add(RESOURCE_LOGS)
-        _LOGGER.info("Registered log API endpoints at /api/config_mcp/logs")
-
-    # Category views (if any category permission is enabled)
-    categories_enabled = (
-        options.get(CONF_CATEGORIES_READ) or
-        options.get(CONF_CATEGORIES_CREATE) or
-        options.get(CONF_CATEGORIES_UPDATE) or
-        options.get(CONF_CATEGORIES_DELETE)
-    )
-    if categories_enabled and RESOURCE_CATEGORIES not in _REGISTERED_VIEWS:
-        hass.http.register_view(CategoryScopeListView())
-        hass.http.register_view(CategoryDetailView())
-        _REGISTERED_VIEWS.add(RESOURCE_CATEGORIES)
-        _LOGGER.info("Registered category API endpoints at /api/config_mcp/categories")
-
-    # Label views (if any label permission is enabled)
-    labels_enabled = (
-        options.get(CONF_LABELS_READ) or
-        options.get(CONF_LABELS_CREATE) or
-        options.get(CONF_LABELS_UPDATE) or
-        options.get(CONF_LABELS_DELETE)
-    )
-    if labels_enabled and RESOURCE_LABELS not in _REGISTERED_VIEWS:
-        hass.http.register_view(LabelListView())
-        hass.http.register_view(LabelDetailView())
-        _REGISTERED_VIEWS.add(RESOURCE_LABELS)
-        _LOGGER.info("Registered label API endpoints at /api/config_mcp/labels")
-
-    # Helper views (if any helper permission is enabled)
-    helpers_enabled = (
-        options.get(CONF_HELPERS_READ) or
-        options.get(CONF_HELPERS_CREATE) or
-        options.get(CONF_HELPERS_UPDATE) or
-        options.get(CONF_HELPERS_DELETE)
-    )
-    if helpers_enabled and RESOURCE_HELPERS not in _REGISTERED_VIEWS:
-        hass.http.register_view(HelperListView())
-        hass.http.register_view(HelperDetailView())
-        _REGISTERED_VIEWS.add(RESOURCE_HELPERS)
-        _LOGGER.info("Registered helper API endpoints at /api/config_mcp/helpers")
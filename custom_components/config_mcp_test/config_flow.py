@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any
 
 import voluptuous as vol
@@ -62,17 +64,112 @@ from .const import (
 )
 
 
-def _migrate_legacy_options(options: dict[str, Any]) -> dict[str, Any]:
+# Toggles shown by each options step, as (option key, default when unset)
+_DISCOVERY_TOGGLES = (
+    (CONF_DISCOVERY_ENTITIES, True),
+    (CONF_DISCOVERY_DEVICES, True),
+    (CONF_DISCOVERY_AREAS, True),
+    (CONF_DISCOVERY_INTEGRATIONS, True),
+    (CONF_DISCOVERY_SERVICES, True),
+)
+_DASHBOARDS_TOGGLES = (
+    (CONF_DASHBOARDS_READ, True),
+    (CONF_DASHBOARDS_CREATE, False),
+    (CONF_DASHBOARDS_UPDATE, True),
+    (CONF_DASHBOARDS_DELETE, False),
+)
+_AUTOMATIONS_TOGGLES = (
+    (CONF_AUTOMATIONS_READ, False),
+    (CONF_AUTOMATIONS_CREATE, False),
+    (CONF_AUTOMATIONS_UPDATE, False),
+    (CONF_AUTOMATIONS_DELETE, False),
+)
+_SCRIPTS_TOGGLES = (
+    (CONF_SCRIPTS_READ, False),
+    (CONF_SCRIPTS_CREATE, False),
+    (CONF_SCRIPTS_UPDATE, False),
+    (CONF_SCRIPTS_DELETE, False),
+)
+_SCENES_TOGGLES = (
+    (CONF_SCENES_READ, False),
+    (CONF_SCENES_CREATE, False),
+    (CONF_SCENES_UPDATE, False),
+    (CONF_SCENES_DELETE, False),
+)
+_CATEGORIES_TOGGLES = (
+    (CONF_CATEGORIES_READ, True),
+    (CONF_CATEGORIES_CREATE, False),
+    (CONF_CATEGORIES_UPDATE, False),
+    (CONF_CATEGORIES_DELETE, False),
+    (CONF_LABELS_READ, True),
+    (CONF_LABELS_CREATE, False),
+    (CONF_LABELS_UPDATE, False),
+    (CONF_LABELS_DELETE, False),
+)
+_HELPERS_TOGGLES = (
+    (CONF_HELPERS_READ, False),
+    (CONF_HELPERS_CREATE, False),
+    (CONF_HELPERS_UPDATE, False),
+    (CONF_HELPERS_DELETE, False),
+)
+
+_VALIDATE_MODES = [VALIDATE_NONE, VALIDATE_WARN, VALIDATE_STRICT]
+
+
+@lru_cache(maxsize=32)
+def _toggle_schema(defaults: tuple[tuple[str, Any], ...]) -> vol.Schema:
+    """Build a schema of boolean toggles.
+
+    Schemas are cached by their defaults, so reopening a step with the same
+    settings reuses the schema built the first time.
+
+    Args:
+        defaults: (option key, current value) pairs, in display order
+
+    Returns:
+        The options form schema
+    """
+    return vol.Schema(
+        {vol.Required(key, default=default): bool for key, default in defaults}
+    )
+
+
+@lru_cache(maxsize=32)
+def _dashboards_schema(
+    defaults: tuple[tuple[str, Any], ...], validate: str
+) -> vol.Schema:
+    """Build the dashboards step schema: toggles plus the validation mode.
+
+    Args:
+        defaults: (option key, current value) pairs, in display order
+        validate: Current dashboard validation mode
+
+    Returns:
+        The options form schema
+    """
+    return _toggle_schema(defaults).extend(
+        {
+            vol.Required(CONF_DASHBOARDS_VALIDATE, default=validate): vol.In(
+                _VALIDATE_MODES
+            ),
+        }
+    )
+
+
+def _migrate_legacy_options(options: Mapping[str, Any]) -> dict[str, Any]:
     """Migrate legacy options format to new granular format.
 
+    The options are only read, and a new dict is always returned, so the
+    config entry's options can be passed in without copying them first.
+
     Args:
-        options: Current options dict (may be legacy or new format)
+        options: Current options (may be legacy or new format)
 
     Returns:
         Options in the new granular format
     """
     # Start with defaults
-    new_options = DEFAULT_OPTIONS.copy()
+    new_options = dict(DEFAULT_OPTIONS)
 
     # If already in new granular format (has create/update/delete keys), merge
     if CONF_DASHBOARDS_CREATE in options:
@@ -127,7 +224,7 @@ class HaCrudConfigFlow(ConfigFlow, domain=DOMAIN):
             return self.async_create_entry(
                 title="Configuration MCP Server",
                 data={},
-                options=DEFAULT_OPTIONS.copy(),
+                options=dict(DEFAULT_OPTIONS),
             )
 
         # Simple confirmation step - configuration happens in options
@@ -152,13 +249,19 @@ class HaCrudOptionsFlow(OptionsFlow):
         """Initialize options flow."""
         self._options: dict[str, Any] = {}
 
+    def _current(
+        self, toggles: tuple[tuple[str, bool], ...]
+    ) -> tuple[tuple[str, Any], ...]:
+        """Pair each toggle with its current value, for the schema cache."""
+        return tuple((key, self._options.get(key, default)) for key, default in toggles)
+
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Show the main menu."""
         # Initialize options from config entry on first load
         if not self._options:
-            self._options = _migrate_legacy_options(dict(self.config_entry.options))
+            self._options = _migrate_legacy_options(self.config_entry.options)
 
         return self.async_show_menu(
             step_id="init",
@@ -180,7 +283,7 @@ class HaCrudOptionsFlow(OptionsFlow):
         """Configure discovery APIs."""
         # Initialize options if not already done
         if not self._options:
-            self._options = _migrate_legacy_options(dict(self.config_entry.options))
+            self._options = _migrate_legacy_options(self.config_entry.options)
 
         if user_input is not None:
             # Update options and save immediately
@@ -189,30 +292,7 @@ class HaCrudOptionsFlow(OptionsFlow):
 
         return self.async_show_form(
             step_id="discovery",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_DISCOVERY_ENTITIES,
-                        default=self._options.get(CONF_DISCOVERY_ENTITIES, True),
-                    ): bool,
-                    vol.Required(
-                        CONF_DISCOVERY_DEVICES,
-                        default=self._options.get(CONF_DISCOVERY_DEVICES, True),
-                    ): bool,
-                    vol.Required(
-                        CONF_DISCOVERY_AREAS,
-                        default=self._options.get(CONF_DISCOVERY_AREAS, True),
-                    ): bool,
-                    vol.Required(
-                        CONF_DISCOVERY_INTEGRATIONS,
-                        default=self._options.get(CONF_DISCOVERY_INTEGRATIONS, True),
-                    ): bool,
-                    vol.Required(
-                        CONF_DISCOVERY_SERVICES,
-                        default=self._options.get(CONF_DISCOVERY_SERVICES, True),
-                    ): bool,
-                }
-            ),
+            data_schema=_toggle_schema(self._current(_DISCOVERY_TOGGLES)),
         )
 
     async def async_step_dashboards(
@@ -221,7 +301,7 @@ class HaCrudOptionsFlow(OptionsFlow):
         """Configure dashboard API."""
         # Initialize options if not already done
         if not self._options:
-            self._options = _migrate_legacy_options(dict(self.config_entry.options))
+            self._options = _migrate_legacy_options(self.config_entry.options)
 
         if user_input is not None:
             self._options.update(user_input)
@@ -229,29 +309,9 @@ class HaCrudOptionsFlow(OptionsFlow):
 
         return self.async_show_form(
             step_id="dashboards",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_DASHBOARDS_READ,
-                        default=self._options.get(CONF_DASHBOARDS_READ, True),
-                    ): bool,
-                    vol.Required(
-                        CONF_DASHBOARDS_CREATE,
-                        default=self._options.get(CONF_DASHBOARDS_CREATE, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_DASHBOARDS_UPDATE,
-                        default=self._options.get(CONF_DASHBOARDS_UPDATE, True),
-                    ): bool,
-                    vol.Required(
-                        CONF_DASHBOARDS_DELETE,
-                        default=self._options.get(CONF_DASHBOARDS_DELETE, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_DASHBOARDS_VALIDATE,
-                        default=self._options.get(CONF_DASHBOARDS_VALIDATE, VALIDATE_WARN),
-                    ): vol.In([VALIDATE_NONE, VALIDATE_WARN, VALIDATE_STRICT]),
-                }
+            data_schema=_dashboards_schema(
+                self._current(_DASHBOARDS_TOGGLES),
+                self._options.get(CONF_DASHBOARDS_VALIDATE, VALIDATE_WARN),
             ),
         )
 
@@ -265,7 +325,7 @@ class HaCrudOptionsFlow(OptionsFlow):
 
         # Initialize options if not already done
         if not self._options:
-            self._options = _migrate_legacy_options(dict(self.config_entry.options))
+            self._options = _migrate_legacy_options(self.config_entry.options)
 
         if user_input is not None:
             self._options.update(user_input)
@@ -327,7 +387,7 @@ class HaCrudOptionsFlow(OptionsFlow):
         """Configure automations API."""
         # Initialize options if not already done
         if not self._options:
-            self._options = _migrate_legacy_options(dict(self.config_entry.options))
+            self._options = _migrate_legacy_options(self.config_entry.options)
 
         if user_input is not None:
             self._options.update(user_input)
@@ -335,26 +395,7 @@ class HaCrudOptionsFlow(OptionsFlow):
 
         return self.async_show_form(
             step_id="automations",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_AUTOMATIONS_READ,
-                        default=self._options.get(CONF_AUTOMATIONS_READ, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_AUTOMATIONS_CREATE,
-                        default=self._options.get(CONF_AUTOMATIONS_CREATE, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_AUTOMATIONS_UPDATE,
-                        default=self._options.get(CONF_AUTOMATIONS_UPDATE, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_AUTOMATIONS_DELETE,
-                        default=self._options.get(CONF_AUTOMATIONS_DELETE, False),
-                    ): bool,
-                }
-            ),
+            data_schema=_toggle_schema(self._current(_AUTOMATIONS_TOGGLES)),
         )
 
     async def async_step_scripts(
@@ -363,7 +404,7 @@ class HaCrudOptionsFlow(OptionsFlow):
         """Configure scripts API."""
         # Initialize options if not already done
         if not self._options:
-            self._options = _migrate_legacy_options(dict(self.config_entry.options))
+            self._options = _migrate_legacy_options(self.config_entry.options)
 
         if user_input is not None:
             self._options.update(user_input)
@@ -371,26 +412,7 @@ class HaCrudOptionsFlow(OptionsFlow):
 
         return self.async_show_form(
             step_id="scripts",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_SCRIPTS_READ,
-                        default=self._options.get(CONF_SCRIPTS_READ, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_SCRIPTS_CREATE,
-                        default=self._options.get(CONF_SCRIPTS_CREATE, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_SCRIPTS_UPDATE,
-                        default=self._options.get(CONF_SCRIPTS_UPDATE, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_SCRIPTS_DELETE,
-                        default=self._options.get(CONF_SCRIPTS_DELETE, False),
-                    ): bool,
-                }
-            ),
+            data_schema=_toggle_schema(self._current(_SCRIPTS_TOGGLES)),
         )
 
     async def async_step_scenes(
@@ -399,7 +421,7 @@ class HaCrudOptionsFlow(OptionsFlow):
         """Configure scenes API."""
         # Initialize options if not already done
         if not self._options:
-            self._options = _migrate_legacy_options(dict(self.config_entry.options))
+            self._options = _migrate_legacy_options(self.config_entry.options)
 
         if user_input is not None:
             self._options.update(user_input)
@@ -407,26 +429,7 @@ class HaCrudOptionsFlow(OptionsFlow):
 
         return self.async_show_form(
             step_id="scenes",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_SCENES_READ,
-                        default=self._options.get(CONF_SCENES_READ, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_SCENES_CREATE,
-                        default=self._options.get(CONF_SCENES_CREATE, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_SCENES_UPDATE,
-                        default=self._options.get(CONF_SCENES_UPDATE, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_SCENES_DELETE,
-                        default=self._options.get(CONF_SCENES_DELETE, False),
-                    ): bool,
-                }
-            ),
+            data_schema=_toggle_schema(self._current(_SCENES_TOGGLES)),
         )
 
     async def async_step_categories(
@@ -435,7 +438,7 @@ class HaCrudOptionsFlow(OptionsFlow):
         """Configure categories and labels API."""
         # Initialize options if not already done
         if not self._options:
-            self._options = _migrate_legacy_options(dict(self.config_entry.options))
+            self._options = _migrate_legacy_options(self.config_entry.options)
 
         if user_input is not None:
             self._options.update(user_input)
@@ -443,42 +446,7 @@ class HaCrudOptionsFlow(OptionsFlow):
 
         return self.async_show_form(
             step_id="categories",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_CATEGORIES_READ,
-                        default=self._options.get(CONF_CATEGORIES_READ, True),
-                    ): bool,
-                    vol.Required(
-                        CONF_CATEGORIES_CREATE,
-                        default=self._options.get(CONF_CATEGORIES_CREATE, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_CATEGORIES_UPDATE,
-                        default=self._options.get(CONF_CATEGORIES_UPDATE, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_CATEGORIES_DELETE,
-                        default=self._options.get(CONF_CATEGORIES_DELETE, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_LABELS_READ,
-                        default=self._options.get(CONF_LABELS_READ, True),
-                    ): bool,
-                    vol.Required(
-                        CONF_LABELS_CREATE,
-                        default=self._options.get(CONF_LABELS_CREATE, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_LABELS_UPDATE,
-                        default=self._options.get(CONF_LABELS_UPDATE, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_LABELS_DELETE,
-                        default=self._options.get(CONF_LABELS_DELETE, False),
-                    ): bool,
-                }
-            ),
+            data_schema=_toggle_schema(self._current(_CATEGORIES_TOGGLES)),
         )
 
     async def async_step_helpers(
@@ -487,7 +455,7 @@ class HaCrudOptionsFlow(OptionsFlow):
         """Configure helpers API."""
         # Initialize options if not already done
         if not self._options:
-            self._options = _migrate_legacy_options(dict(self.config_entry.options))
+            self._options = _migrate_legacy_options(self.config_entry.options)
 
         if user_input is not None:
             self._options.update(user_input)
@@ -495,24 +463,5 @@ class HaCrudOptionsFlow(OptionsFlow):
 
         return self.async_show_form(
             step_id="helpers",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_HELPERS_READ,
-                        default=self._options.get(CONF_HELPERS_READ, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_HELPERS_CREATE,
-                        default=self._options.get(CONF_HELPERS_CREATE, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_HELPERS_UPDATE,
-                        default=self._options.get(CONF_HELPERS_UPDATE, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_HELPERS_DELETE,
-                        default=self._options.get(CONF_HELPERS_DELETE, False),
-                    ): bool,
-                }
-            ),
+            data_schema=_toggle_schema(self._current(_HELPERS_TOGGLES)),
         )
@@ -1,5 +1,7 @@
 """Constants for Configuration MCP Server component."""
 
+from types import MappingProxyType
+
 DOMAIN = "config_mcp_test"
 
 # Configuration keys - Discovery APIs (read-only)
@@ -126,8 +128,8 @@ OIDC_DOMAIN = "oidc_provider"
 # OAuth metadata endpoint path
 OAUTH_METADATA_PATH = "/.well-known/oauth-authorization-server"
 
-# Default configuration
-DEFAULT_OPTIONS = {
+# Default configuration (read-only; take dict(DEFAULT_OPTIONS) for a mutable copy)
+DEFAULT_OPTIONS = MappingProxyType({
     # Discovery APIs - all enabled by default
     CONF_DISCOVERY_ENTITIES: True,
     CONF_DISCOVERY_DEVICES: True,
@@ -176,7 +178,7 @@ DEFAULT_OPTIONS = {
     CONF_MCP_SERVER: True,
     # MCP OAuth - disabled by default (requires hass-oidc-auth)
     CONF_MCP_OAUTH_ENABLED: False,
-}
+})
 
 # Deprecated - kept for migration
 DEFAULT_RESOURCES = [RESOURCE_DASHBOARDS]
@@ -198,6 +200,10 @@ API_BASE_PATH_SERVICES = "/api/config_mcp/services"
 API_BASE_PATH_RESOURCES = "/api/config_mcp/resources"
 API_BASE_PATH_LOGS = "/api/config_mcp/logs"
 
+# Discovery API detail paths
+API_BASE_PATH_AREA_DETAIL = f"{API_BASE_PATH_AREAS}/{{area_id}}"
+API_BASE_PATH_FLOOR_DETAIL = f"{API_BASE_PATH_FLOORS}/{{floor_id}}"
+
 # Organization API paths
 API_BASE_PATH_CATEGORIES = "/api/config_mcp/categories"
 API_BASE_PATH_LABELS = "/api/config_mcp/labels"
@@ -271,6 +277,13 @@ ERR_LABEL_EXISTS = "label_already_exists"
 # Data keys for hass.data storage
 DATA_DASHBOARDS_COLLECTION = f"{DOMAIN}_dashboards_collection"
 DATA_AUTOMATIONS_COMPONENT = f"{DOMAIN}_automations_component"
+DATA_HELPER_STORES = f"{DOMAIN}_helper_stores"
+DATA_HELPER_DATA = f"{DOMAIN}_helper_data"
+DATA_HELPER_PENDING_SAVES = f"{DOMAIN}_helper_pending_saves"
+DATA_HELPER_SAVE_TIMERS = f"{DOMAIN}_helper_save_timers"
+DATA_HELPER_PENDING_RELOADS = f"{DOMAIN}_helper_pending_reloads"
+DATA_REGISTRY_CACHES = f"{DOMAIN}_registry_caches"
+DATA_INTEGRATION_NAMES = f"{DOMAIN}_integration_names"
 
 # MCP Server configuration
 API_BASE_PATH_MCP = "/api/config_mcp/mcp"
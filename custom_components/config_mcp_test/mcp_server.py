@@ -38,7 +38,7 @@ def get_config_options(hass: HomeAssistant) -> dict[str, Any]:
     Returns:
         Configuration options dict, merged with defaults
     """
-    options = DEFAULT_OPTIONS.copy()
+    options = dict(DEFAULT_OPTIONS)
 
     # Get options from config entry
     if DOMAIN in hass.data:
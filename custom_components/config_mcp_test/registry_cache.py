@@ -0,0 +1,131 @@
+"""Caches of data derived from the Home Assistant registries.
+
+Several views aggregate the area, device, entity and floor registries on
+every request, while the registries themselves change rarely. Each kind of
+aggregate is described by a RegistryCacheSpec: how to build it and which
+registry update events make it stale. The caches are created when the
+config entry is set up and removed, together with their event listeners,
+when it unloads.
+
+Usage:
+    from ..registry_cache import RegistryCacheSpec, async_get_registry_data
+
+    ENTITY_COUNTS = RegistryCacheSpec(
+        "entity_counts", (er.EVENT_ENTITY_REGISTRY_UPDATED,), _build_entity_counts
+    )
+
+    counts = async_get_registry_data(hass, ENTITY_COUNTS)
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import DATA_REGISTRY_CACHES
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class RegistryCacheSpec(Generic[_T]):
+    """Definition of a value derived from the registries."""
+
+    name: str
+    # Registry update events after which the value is rebuilt
+    events: tuple[str, ...]
+    build: Callable[[HomeAssistant], _T]
+
+
+class RegistryCache(Generic[_T]):
+    """A registry-derived value, kept until one of its registries changes.
+
+    Any of the spec's update events drops the value; it is rebuilt on the
+    next access.
+    """
+
+    def __init__(self, hass: HomeAssistant, spec: RegistryCacheSpec[_T]) -> None:
+        """Initialize the cache and subscribe to the registry updates."""
+        self._hass = hass
+        self._build = spec.build
+        self._value: _T | None = None
+        self._unsubscribe: list[Callable[[], None]] = [
+            hass.bus.async_listen(event_type, self._async_invalidate)
+            for event_type in spec.events
+        ]
+
+    @callback
+    def _async_invalidate(self, event: Event) -> None:
+        """Drop the value so it is rebuilt on next use."""
+        self._value = None
+
+    @callback
+    def async_get(self) -> _T:
+        """Get the value, building it if needed."""
+        if self._value is None:
+            self._value = self._build(self._hass)
+        return self._value
+
+    @callback
+    def async_unsubscribe(self) -> None:
+        """Stop listening for registry updates."""
+        while self._unsubscribe:
+            self._unsubscribe.pop()()
+
+
+@callback
+def async_setup_registry_caches(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    specs: Iterable[RegistryCacheSpec[Any]],
+) -> None:
+    """Create the registry caches for a config entry.
+
+    The caches and their listeners are removed when the entry unloads.
+
+    Args:
+        hass: Home Assistant instance
+        entry: The config entry being set up
+        specs: The values to cache
+    """
+    caches: dict[RegistryCacheSpec[Any], RegistryCache[Any]] = {
+        spec: RegistryCache(hass, spec) for spec in specs
+    }
+    hass.data[DATA_REGISTRY_CACHES] = caches
+
+    @callback
+    def _async_remove_caches() -> None:
+        if hass.data.get(DATA_REGISTRY_CACHES) is caches:
+            del hass.data[DATA_REGISTRY_CACHES]
+        for cache in caches.values():
+            cache.async_unsubscribe()
+        _LOGGER.debug("Removed %d registry caches", len(caches))
+
+    entry.async_on_unload(_async_remove_caches)
+
+
+@callback
+def async_get_registry_data(hass: HomeAssistant, spec: RegistryCacheSpec[_T]) -> _T:
+    """Get a registry-derived value, cached while the config entry is loaded.
+
+    HTTP views stay registered after the entry unloads; without the caches
+    they build the value on every call instead of subscribing anew.
+
+    Args:
+        hass: Home Assistant instance
+        spec: The value to get
+
+    Returns:
+        The up to date value
+    """
+    cache: RegistryCache[_T] | None = hass.data.get(DATA_REGISTRY_CACHES, {}).get(spec)
+    if cache is None:
+        return spec.build(hass)
+    return cache.async_get()
@@ -6,6 +6,7 @@ Each tool registers itself using the @mcp_tool decorator.
 from __future__ import annotations
 
 import logging
+from collections import Counter
 from typing import Any
 
 from homeassistant.core import HomeAssistant
@@ -52,16 +53,12 @@ async def list_areas(hass: HomeAssistant, arguments: dict[str, Any]) -> list[dic
     floor_filter = arguments.get("floor")
 
     # Count devices and entities per area
-    area_device_counts: dict[str, int] = {}
-    area_entity_counts: dict[str, int] = {}
-
-    for device in device_registry.devices.values():
-        if device.area_id:
-            area_device_counts[device.area_id] = area_device_counts.get(device.area_id, 0) + 1
-
-    for entry in entity_registry.entities.values():
-        if entry.area_id:
-            area_entity_counts[entry.area_id] = area_entity_counts.get(entry.area_id, 0) + 1
+    area_device_counts = Counter(
+        device.area_id for device in device_registry.devices.values() if device.area_id
+    )
+    area_entity_counts = Counter(
+        entry.area_id for entry in entity_registry.entities.values() if entry.area_id
+    )
 
     areas = []
     for area in area_registry.async_list_areas():
@@ -110,24 +107,23 @@ async def get_area(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str,
     if area is None:
         raise ValueError(f"Area '{area_id}' not found")
 
-    # Get devices in area
+    # Get devices in area (indexed by area in the registry)
     devices = []
-    for device in device_registry.devices.values():
-        if device.area_id == area_id:
-            devices.append({
-                "id": device.id,
-                "name": device.name_by_user or device.name,
-            })
+    for device in dr.async_entries_for_area(device_registry, area_id):
+        devices.append({
+            "id": device.id,
+            "name": device.name_by_user or device.name,
+        })
 
-    # Get entities in area
+    # Get entities in area (indexed by area in the registry)
     entities = []
-    for entry in entity_registry.entities.values():
-        if entry.area_id == area_id:
-            state = hass.states.get(entry.entity_id)
-            entities.append({
-                "entity_id": entry.entity_id,
-                "state": state.state if state else "unavailable",
-            })
+    get_state = hass.states.get
+    for entry in er.async_entries_for_area(entity_registry, area_id):
+        state = get_state(entry.entity_id)
+        entities.append({
+            "entity_id": entry.entity_id,
+            "state": state.state if state else "unavailable",
+        })
 
     data: dict[str, Any] = {
         "id": area.id,
@@ -163,10 +159,9 @@ async def list_floors(hass: HomeAssistant, arguments: dict[str, Any]) -> list[di
     area_registry = ar.async_get(hass)
 
     # Count areas per floor
-    floor_area_counts: dict[str, int] = {}
-    for area in area_registry.async_list_areas():
-        if area.floor_id:
-            floor_area_counts[area.floor_id] = floor_area_counts.get(area.floor_id, 0) + 1
+    floor_area_counts = Counter(
+        area.floor_id for area in area_registry.async_list_areas() if area.floor_id
+    )
 
     floors = []
     for floor in floor_registry.async_list_floors():
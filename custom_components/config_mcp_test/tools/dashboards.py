@@ -30,7 +30,7 @@ _LOGGER = logging.getLogger(__name__)
 
 def _get_config_options(hass: HomeAssistant) -> dict[str, Any]:
     """Get the current configuration options for config_mcp."""
-    options = DEFAULT_OPTIONS.copy()
+    options = dict(DEFAULT_OPTIONS)
     if DOMAIN in hass.data:
         for entry_id in hass.data[DOMAIN]:
             for entry in hass.config_entries.async_entries(DOMAIN):
@@ -6,6 +6,7 @@ Each tool registers itself using the @mcp_tool decorator.
 from __future__ import annotations
 
 import logging
+from collections import Counter
 from typing import Any
 
 from homeassistant.core import HomeAssistant
@@ -78,10 +79,9 @@ async def list_devices(hass: HomeAssistant, arguments: dict[str, Any]) -> list[d
         area_to_floor[area.id] = area.floor_id
 
     # Count entities per device
-    device_entity_counts: dict[str, int] = {}
-    for entry in entity_registry.entities.values():
-        if entry.device_id:
-            device_entity_counts[entry.device_id] = device_entity_counts.get(entry.device_id, 0) + 1
+    device_entity_counts = Counter(
+        entry.device_id for entry in entity_registry.entities.values() if entry.device_id
+    )
 
     devices = []
     for device in device_registry.devices.values():
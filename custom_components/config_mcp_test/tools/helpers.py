@@ -10,21 +10,23 @@ Each tool registers itself using the @mcp_tool decorator.
 from __future__ import annotations
 
 import logging
-import uuid
 from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.storage import Store
 
 from ..mcp_registry import mcp_tool
 from ..const import HELPER_DOMAINS
+from ..views.helpers import (
+    _create_helper,
+    _delete_helper,
+    _get_helper_by_id,
+    _get_helpers_for_domain,
+    _update_helper,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
-# Storage version must match Home Assistant's internal version for these domains
-STORAGE_VERSION = 1
-
 
 # Domain-specific required fields for creation
 HELPER_CREATE_FIELDS: dict[str, list[str]] = {
@@ -49,258 +51,6 @@ HELPER_OPTIONAL_FIELDS: dict[str, list[str]] = {
 }
 
 
-async def _get_helpers_for_domain(hass: HomeAssistant, domain: str) -> list[dict[str, Any]]:
-    """Get all helpers for a specific domain using the Store API.
-
-    Args:
-        hass: Home Assistant instance
-        domain: The helper domain (e.g., 'input_boolean')
-
-    Returns:
-        List of helper configurations
-    """
-    helpers = []
-
-    # Use Store API to read from .storage/core.{domain}
-    store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"core.{domain}")
-    data = await store.async_load()
-
-    if data is None:
-        return helpers
-
-    # The storage format has an "items" key containing the list of helpers
-    items = data.get("items", [])
-
-    for item in items:
-        if isinstance(item, dict):
-            helpers.append({
-                "id": item.get("id"),
-                "name": item.get("name"),
-                "domain": domain,
-                **{k: v for k, v in item.items() if k not in ("id", "name")},
-            })
-
-    return helpers
-
-
-async def _get_helper_by_id(
-    hass: HomeAssistant,
-    helper_id: str
-) -> tuple[str | None, dict[str, Any] | None]:
-    """Get a specific helper by ID using the Store API.
-
-    Args:
-        hass: Home Assistant instance
-        helper_id: The helper ID
-
-    Returns:
-        Tuple of (domain, helper_config) or (None, None) if not found
-    """
-    for domain in HELPER_DOMAINS:
-        try:
-            store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"core.{domain}")
-            data = await store.async_load()
-
-            if data is None:
-                continue
-
-            items = data.get("items", [])
-            for item in items:
-                if isinstance(item, dict) and item.get("id") == helper_id:
-                    return domain, {
-                        "id": item.get("id"),
-                        "name": item.get("name"),
-                        "domain": domain,
-                        **{k: v for k, v in item.items() if k not in ("id", "name")},
-                    }
-        except Exception as err:
-            _LOGGER.warning("Error searching for helper in domain %s: %s", domain, err)
-            continue
-
-    return None, None
-
-
-def _generate_helper_id(name: str) -> str:
-    """Generate a helper ID from the name.
-
-    Args:
-        name: The helper name
-
-    Returns:
-        A valid helper ID
-    """
-    # Convert name to lowercase and replace spaces with underscores
-    helper_id = name.lower().replace(" ", "_")
-    # Remove any characters that aren't alphanumeric or underscores
-    helper_id = "".join(c for c in helper_id if c.isalnum() or c == "_")
-    # Ensure it doesn't start with a number
-    if helper_id and helper_id[0].isdigit():
-        helper_id = f"_{helper_id}"
-    return helper_id or f"helper_{uuid.uuid4().hex[:8]}"
-
-
-async def _create_helper(
-    hass: HomeAssistant,
-    domain: str,
-    config: dict[str, Any],
-) -> dict[str, Any]:
-    """Create a new helper using the Store API.
-
-    Args:
-        hass: Home Assistant instance
-        domain: The helper domain
-        config: The helper configuration
-
-    Returns:
-        The created helper data
-
-    Raises:
-        ValueError: If the domain is not supported or creation fails
-    """
-    if domain not in HELPER_DOMAINS:
-        raise ValueError(f"Invalid helper domain: {domain}")
-
-    # Use Store API to read/write .storage/core.{domain}
-    store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"core.{domain}")
-    data = await store.async_load() or {"items": []}
-
-    # Generate ID from name if not provided
-    helper_id = config.get("id") or _generate_helper_id(config["name"])
-
-    # Check for duplicate ID
-    existing_ids = {item.get("id") for item in data.get("items", [])}
-    if helper_id in existing_ids:
-        raise ValueError(f"Helper with ID '{helper_id}' already exists")
-
-    # Build the helper configuration
-    new_helper = {
-        "id": helper_id,
-        **config,
-    }
-
-    # Add to items list
-    if "items" not in data:
-        data["items"] = []
-    data["items"].append(new_helper)
-
-    # Save to storage
-    await store.async_save(data)
-
-    # Reload the domain to pick up the new helper
-    try:
-        await hass.services.async_call(domain, "reload", blocking=True)
-    except Exception as err:
-        _LOGGER.warning("Failed to reload %s after creation: %s", domain, err)
-
-    return {
-        "id": helper_id,
-        "name": config.get("name"),
-        "domain": domain,
-        **{k: v for k, v in new_helper.items() if k not in ("id", "name")},
-    }
-
-
-async def _update_helper(
-    hass: HomeAssistant,
-    domain: str,
-    helper_id: str,
-    updates: dict[str, Any],
-) -> dict[str, Any]:
-    """Update an existing helper using the Store API.
-
-    Args:
-        hass: Home Assistant instance
-        domain: The helper domain
-        helper_id: The helper ID
-        updates: The fields to update
-
-    Returns:
-        The updated helper data
-
-    Raises:
-        ValueError: If update fails
-    """
-    # Use Store API to read/write .storage/core.{domain}
-    store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"core.{domain}")
-    data = await store.async_load()
-
-    if data is None:
-        raise ValueError(f"Helper domain {domain} has no stored data")
-
-    items = data.get("items", [])
-
-    # Find and update the helper
-    updated_item = None
-    for i, item in enumerate(items):
-        if isinstance(item, dict) and item.get("id") == helper_id:
-            # Merge updates with existing item (don't change id)
-            items[i] = {**item, **updates, "id": helper_id}
-            updated_item = items[i]
-            break
-
-    if updated_item is None:
-        raise ValueError(f"Helper '{helper_id}' not found in {domain}")
-
-    # Save to storage
-    data["items"] = items
-    await store.async_save(data)
-
-    # Reload the domain to pick up the changes
-    try:
-        await hass.services.async_call(domain, "reload", blocking=True)
-    except Exception as err:
-        _LOGGER.warning("Failed to reload %s after update: %s", domain, err)
-
-    return {
-        "id": updated_item.get("id"),
-        "name": updated_item.get("name"),
-        "domain": domain,
-        **{k: v for k, v in updated_item.items() if k not in ("id", "name")},
-    }
-
-
-async def _delete_helper(
-    hass: HomeAssistant,
-    domain: str,
-    helper_id: str,
-) -> None:
-    """Delete a helper using the Store API.
-
-    Args:
-        hass: Home Assistant instance
-        domain: The helper domain
-        helper_id: The helper ID
-
-    Raises:
-        ValueError: If deletion fails
-    """
-    # Use Store API to read/write .storage/core.{domain}
-    store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"core.{domain}")
-    data = await store.async_load()
-
-    if data is None:
-        raise ValueError(f"Helper domain {domain} has no stored data")
-
-    items = data.get("items", [])
-
-    # Find and remove the helper
-    original_count = len(items)
-    items = [item for item in items if not (isinstance(item, dict) and item.get("id") == helper_id)]
-
-    if len(items) == original_count:
-        raise ValueError(f"Helper '{helper_id}' not found in {domain}")
-
-    # Save to storage
-    data["items"] = items
-    await store.async_save(data)
-
-    # Reload the domain to pick up the changes
-    try:
-        await hass.services.async_call(domain, "reload", blocking=True)
-    except Exception as err:
-        _LOGGER.warning("Failed to reload %s after deletion: %s", domain, err)
-
-
 def _format_helper(
     helper_config: dict[str, Any],
     domain: str,
@@ -643,9 +393,10 @@ async def create_helper(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[
         if field in arguments and field != "icon":  # icon already handled
             create_data[field] = arguments[field]
 
-    # Execute the create command
+    # Execute the create command, waiting for the reload so the entity
+    # matches once the tool returns
     try:
-        result = await _create_helper(hass, domain, create_data)
+        result = await _create_helper(hass, domain, create_data, sync_reload=True)
     except ValueError as err:
         raise ValueError(f"Failed to create {domain}: {err}") from err
 
@@ -783,9 +534,10 @@ async def update_helper(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[
     if not update_data:
         raise ValueError("No update fields provided")
 
-    # Execute the update command
+    # Execute the update command, waiting for the reload so the entity
+    # matches once the tool returns
     try:
-        await _update_helper(hass, domain, helper_id, update_data)
+        await _update_helper(hass, domain, helper_id, update_data, sync_reload=True)
     except ValueError as err:
         raise ValueError(f"Failed to update {domain}: {err}") from err
 
@@ -843,9 +595,10 @@ async def delete_helper(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[
     if not helper_exists:
         raise ValueError(f"Helper '{entity_id}' not found")
 
-    # Execute the delete command
+    # Execute the delete command, waiting for the reload so the entity
+    # matches once the tool returns
     try:
-        await _delete_helper(hass, domain, helper_id)
+        await _delete_helper(hass, domain, helper_id, sync_reload=True)
     except ValueError as err:
         raise ValueError(f"Failed to delete {domain}: {err}") from err
 
@@ -6,6 +6,7 @@ Each tool registers itself using the @mcp_tool decorator.
 from __future__ import annotations
 
 import logging
+from collections import Counter
 from typing import Any
 
 from homeassistant.core import HomeAssistant
@@ -46,17 +47,20 @@ async def list_integrations(hass: HomeAssistant, arguments: dict[str, Any]) -> l
             }
         integrations[domain]["config_entries"] += 1
 
+    get_entry = integrations.get
+
     # Count devices per integration
     for device in device_registry.devices.values():
         for identifier in device.identifiers:
-            domain = identifier[0]
-            if domain in integrations:
-                integrations[domain]["device_count"] += 1
+            integration = get_entry(identifier[0])
+            if integration is not None:
+                integration["device_count"] += 1
 
     # Count entities per integration
     for entry in entity_registry.entities.values():
-        if entry.platform in integrations:
-            integrations[entry.platform]["entity_count"] += 1
+        integration = get_entry(entry.platform)
+        if integration is not None:
+            integration["entity_count"] += 1
 
     result = list(integrations.values())
     result.sort(key=lambda x: x["domain"])
@@ -105,11 +109,9 @@ async def get_integration(hass: HomeAssistant, arguments: dict[str, Any]) -> dic
                 break
 
     # Count entities by domain for this integration
-    entity_domains: dict[str, int] = {}
-    for entry in entity_registry.entities.values():
-        if entry.platform == domain:
-            entity_domain = entry.entity_id.split(".")[0]
-            entity_domains[entity_domain] = entity_domains.get(entity_domain, 0) + 1
+    entity_domains = dict(Counter(
+        entry.domain for entry in entity_registry.entities.values() if entry.platform == domain
+    ))
 
     return {
         "domain": domain,
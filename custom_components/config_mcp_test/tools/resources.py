@@ -12,6 +12,7 @@ from homeassistant.core import HomeAssistant
 
 from ..const import LOVELACE_DATA
 from ..mcp_registry import mcp_tool
+from ..views.resources import _async_ensure_resources_loaded, _get_resource_items
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,22 +41,18 @@ async def list_resources(hass: HomeAssistant, arguments: dict[str, Any]) -> list
     resources = []
     try:
         resource_collection = lovelace_data.resources
+        await _async_ensure_resources_loaded(resource_collection)
 
-        # Ensure storage collection is loaded
-        if hasattr(resource_collection, 'loaded') and not resource_collection.loaded:
-            if hasattr(resource_collection, 'async_load'):
-                await resource_collection.async_load()
-                resource_collection.loaded = True
+        items = _get_resource_items(resource_collection)
 
-        # async_items() is actually a synchronous method
-        items = resource_collection.async_items()
-
-        for item in items:
-            resources.append({
+        resources = [
+            {
                 "id": item.get("id"),
                 "type": item.get("type"),
                 "url": item.get("url"),
-            })
+            }
+            for item in items
+        ]
     except Exception as err:
         _LOGGER.warning("Error getting lovelace resources: %s", err)
 
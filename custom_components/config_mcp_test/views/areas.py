@@ -3,28 +3,263 @@
 from __future__ import annotations
 
 import logging
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from http import HTTPStatus
+from operator import attrgetter, itemgetter
 from typing import Any
 
 from aiohttp import web
 
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.const import CONTENT_TYPE_JSON
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import area_registry as ar
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import floor_registry as fr
+from homeassistant.helpers.json import json_bytes
 
 from ..const import (
+    API_BASE_PATH_AREA_DETAIL,
     API_BASE_PATH_AREAS,
+    API_BASE_PATH_FLOOR_DETAIL,
     API_BASE_PATH_FLOORS,
     ERR_AREA_NOT_FOUND,
     ERR_FLOOR_NOT_FOUND,
 )
+from ..registry_cache import RegistryCacheSpec, async_get_registry_data
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Registry entry fields read by the area index, fetched in one C-level call
+_DEVICE_FIELDS = attrgetter("id", "area_id", "disabled_by")
+_ENTITY_FIELDS = attrgetter("entity_id", "area_id", "device_id", "disabled_by")
+
+
+def _index_area_members(
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> tuple[dict[str, list[str]], dict[str, list[str]]]:
+    """Index the enabled devices and entities in each area.
+
+    Entities without an area of their own belong to the area of their
+    device. Each registry is walked once, and the device areas are looked
+    up from a plain dict rather than through the device registry.
+
+    Args:
+        device_registry: The device registry
+        entity_registry: The entity registry
+
+    Returns:
+        Tuple of (device IDs, entity IDs) keyed by area ID
+    """
+    area_devices: defaultdict[str, list[str]] = defaultdict(list)
+    area_entities: defaultdict[str, list[str]] = defaultdict(list)
+    device_areas: dict[str, str] = {}
+
+    # disabled_by is read directly; the disabled property wraps the same
+    # check in a Python-level call for every entry
+    for device_id, area_id, disabled_by in map(
+        _DEVICE_FIELDS, device_registry.devices.values()
+    ):
+        if area_id:
+            device_areas[device_id] = area_id
+            if disabled_by is None:
+                area_devices[area_id].append(device_id)
+
+    device_area = device_areas.get
+    for entity_id, area_id, device_id, disabled_by in map(
+        _ENTITY_FIELDS, entity_registry.entities.values()
+    ):
+        # Skip disabled entities before resolving their area
+        if disabled_by is not None:
+            continue
+        area_id = area_id or device_area(device_id)
+        if area_id:
+            area_entities[area_id].append(entity_id)
+
+    return dict(area_devices), dict(area_entities)
+
+
+@dataclass
+class _AreaAggregates:
+    """Per-area and per-floor aggregates of the registries.
+
+    Serialized responses built from the aggregates are kept with them, so
+    they are dropped together when a registry changes.
+    """
+
+    area_devices: dict[str, list[str]]
+    area_entities: dict[str, list[str]]
+    area_device_counts: dict[str, int]
+    area_entity_counts: dict[str, int]
+    floor_area_counts: Counter[str]
+    responses: dict[tuple[str, str], bytes] = field(default_factory=dict)
+
+    def get_json(self, key: tuple[str, str], build: Callable[[], Any]) -> bytes:
+        """Get a serialized response, building it on first use.
+
+        Args:
+            key: Identifies the response, e.g. the endpoint and its filter
+            build: Returns the response data when it is not cached
+
+        Returns:
+            The JSON encoded response body
+        """
+        body = self.responses.get(key)
+        if body is None:
+            body = self.responses[key] = json_bytes(build())
+        return body
+
+
+def _build_area_aggregates(hass: HomeAssistant) -> _AreaAggregates:
+    """Aggregate the devices, entities and areas per area and floor.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        The area aggregates
+    """
+    area_devices, area_entities = _index_area_members(
+        dr.async_get(hass), er.async_get(hass)
+    )
+    return _AreaAggregates(
+        area_devices=area_devices,
+        area_entities=area_entities,
+        area_device_counts={
+            area_id: len(ids) for area_id, ids in area_devices.items()
+        },
+        area_entity_counts={
+            area_id: len(ids) for area_id, ids in area_entities.items()
+        },
+        floor_area_counts=Counter(
+            area.floor_id
+            for area in ar.async_get(hass).async_list_areas()
+            if area.floor_id
+        ),
+    )
+
+
+# Area aggregates, rebuilt after any of the registries they read changes
+AREA_AGGREGATES = RegistryCacheSpec(
+    "area_aggregates",
+    (
+        ar.EVENT_AREA_REGISTRY_UPDATED,
+        dr.EVENT_DEVICE_REGISTRY_UPDATED,
+        er.EVENT_ENTITY_REGISTRY_UPDATED,
+        fr.EVENT_FLOOR_REGISTRY_UPDATED,
+    ),
+    _build_area_aggregates,
+)
+
+
+def _json_response(body: bytes) -> web.Response:
+    """Wrap an already encoded JSON body in a response.
+
+    Args:
+        body: The JSON encoded body, from json_bytes or the response cache
+
+    Returns:
+        A compressed 200 response with a JSON content type, as
+        HomeAssistantView.json builds it
+    """
+    response = web.Response(body=body, content_type=CONTENT_TYPE_JSON)
+    response.enable_compression()
+    return response
+
+
+def _build_area_list(
+    hass: HomeAssistant, aggregates: _AreaAggregates, floor_filter: str
+) -> list[dict[str, Any]]:
+    """Build the area list response.
+
+    Args:
+        hass: Home Assistant instance
+        aggregates: Up to date area aggregates
+        floor_filter: Only include areas on this floor, if set
+
+    Returns:
+        Area data sorted by name
+    """
+    area_registry = ar.async_get(hass)
+    floor_registry = fr.async_get(hass)
+    area_device_counts = aggregates.area_device_counts
+    area_entity_counts = aggregates.area_entity_counts
+
+    # (sort key, area data) pairs, so the key is computed while building
+    areas: list[tuple[str, dict[str, Any]]] = []
+    for area in area_registry.async_list_areas():
+        # Floor filter
+        if floor_filter and area.floor_id != floor_filter:
+            continue
+
+        area_data: dict[str, Any] = {
+            "id": area.id,
+            "name": area.name,
+            "floor_id": area.floor_id,
+            "icon": area.icon,
+            "picture": area.picture,
+            "aliases": list(area.aliases) if area.aliases else [],
+            "device_count": area_device_counts.get(area.id, 0),
+            "entity_count": area_entity_counts.get(area.id, 0),
+        }
+
+        # Add floor name if available
+        if area.floor_id:
+            floor = floor_registry.async_get_floor(area.floor_id)
+            if floor:
+                area_data["floor_name"] = floor.name
+
+        areas.append((area.name.lower(), area_data))
+
+    # Sort by name
+    areas.sort(key=itemgetter(0))
+
+    return [area_data for _, area_data in areas]
+
+
+def _build_floor_list(
+    hass: HomeAssistant, aggregates: _AreaAggregates
+) -> list[dict[str, Any]]:
+    """Build the floor list response.
+
+    Args:
+        hass: Home Assistant instance
+        aggregates: Up to date area aggregates
+
+    Returns:
+        Floor data sorted by level, then name
+    """
+    floor_registry = fr.async_get(hass)
+
+    # Areas per floor
+    floor_area_counts = aggregates.floor_area_counts
+
+    # (sort key, floor data) pairs, so the key is computed while building
+    floors: list[tuple[tuple[int, str], dict[str, Any]]] = []
+    for floor in floor_registry.async_list_floors():
+        floors.append((
+            (floor.level or 0, floor.name.lower()),
+            {
+                "id": floor.floor_id,
+                "name": floor.name,
+                "level": floor.level,
+                "icon": floor.icon,
+                "aliases": list(floor.aliases) if floor.aliases else [],
+                "area_count": floor_area_counts.get(floor.floor_id, 0),
+            },
+        ))
+
+    # Sort by level
+    floors.sort(key=itemgetter(0))
+
+    return [floor_data for _, floor_data in floors]
+
+
 class AreaListView(HomeAssistantView):
     """View to list all areas."""
 
@@ -43,67 +278,29 @@ class AreaListView(HomeAssistantView):
         """
         hass: HomeAssistant = request.app["hass"]
 
-        floor_filter = request.query.get("floor")
-
-        # Get registries
-        area_registry = ar.async_get(hass)
-        device_registry = dr.async_get(hass)
-        entity_registry = er.async_get(hass)
-        floor_registry = fr.async_get(hass)
-
-        # Count devices and entities per area
-        area_device_counts: dict[str, int] = {}
-        area_entity_counts: dict[str, int] = {}
-
-        for device in device_registry.devices.values():
-            if device.area_id and not device.disabled:
-                area_device_counts[device.area_id] = area_device_counts.get(device.area_id, 0) + 1
-
-        for entity in entity_registry.entities.values():
-            area_id = entity.area_id
-            # If entity doesn't have area, check its device
-            if not area_id and entity.device_id:
-                device = device_registry.async_get(entity.device_id)
-                if device:
-                    area_id = device.area_id
-            if area_id and not entity.disabled:
-                area_entity_counts[area_id] = area_entity_counts.get(area_id, 0) + 1
-
-        areas = []
-        for area in area_registry.async_list_areas():
-            # Floor filter
-            if floor_filter and area.floor_id != floor_filter:
-                continue
-
-            area_data: dict[str, Any] = {
-                "id": area.id,
-                "name": area.name,
-                "floor_id": area.floor_id,
-                "icon": area.icon,
-                "picture": area.picture,
-                "aliases": list(area.aliases) if area.aliases else [],
-                "device_count": area_device_counts.get(area.id, 0),
-                "entity_count": area_entity_counts.get(area.id, 0),
-            }
+        floor_filter = request.query.get("floor", "")
 
-            # Add floor name if available
-            if area.floor_id:
-                floor = floor_registry.async_get_floor(area.floor_id)
-                if floor:
-                    area_data["floor_name"] = floor.name
+        # Nothing to aggregate without areas
+        if not ar.async_get(hass).async_list_areas():
+            return self.json([])
 
-            areas.append(area_data)
+        # Only cache known floors so arbitrary filters can't grow the cache
+        if floor_filter and fr.async_get(hass).async_get_floor(floor_filter) is None:
+            return self.json([])
 
-        # Sort by name
-        areas.sort(key=lambda x: x["name"].lower())
+        aggregates = async_get_registry_data(hass, AREA_AGGREGATES)
 
-        return self.json(areas)
+        body = aggregates.get_json(
+            ("areas", floor_filter),
+            lambda: _build_area_list(hass, aggregates, floor_filter),
+        )
+        return _json_response(body)
 
 
 class AreaDetailView(HomeAssistantView):
     """View to get single area details with devices and entities."""
 
-    url = API_BASE_PATH_AREAS + "/{area_id}"
+    url = API_BASE_PATH_AREA_DETAIL
     name = "api:config_mcp:area"
     requires_auth = True
 
@@ -150,51 +347,54 @@ class AreaDetailView(HomeAssistantView):
             if floor:
                 area_data["floor_name"] = floor.name
 
+        aggregates = async_get_registry_data(hass, AREA_AGGREGATES)
+
         # Get devices in this area
         devices = []
-        for device in device_registry.devices.values():
-            if device.area_id == area_id and not device.disabled:
-                devices.append({
-                    "id": device.id,
-                    "name": device.name_by_user or device.name,
-                    "manufacturer": device.manufacturer,
-                    "model": device.model,
-                })
+        get_device = device_registry.devices.get
+        for device_id in aggregates.area_devices.get(area_id, ()):
+            device = get_device(device_id)
+            if device is None:
+                continue
+            devices.append({
+                "id": device.id,
+                "name": device.name_by_user or device.name,
+                "manufacturer": device.manufacturer,
+                "model": device.model,
+            })
         area_data["devices"] = sorted(devices, key=lambda x: (x.get("name") or "").lower())
 
         # Get entities in this area (directly assigned or via device)
         entities = []
-        entity_domains: dict[str, int] = {}
 
-        for entity in entity_registry.entities.values():
-            if entity.disabled:
+        get_entity = entity_registry.entities.get
+        get_state = hass.states.get
+        for entity_id in aggregates.area_entities.get(area_id, ()):
+            entity = get_entity(entity_id)
+            if entity is None:
                 continue
 
-            entity_area = entity.area_id
-            # If entity doesn't have area, check its device
-            if not entity_area and entity.device_id:
-                device = device_registry.async_get(entity.device_id)
-                if device:
-                    entity_area = device.area_id
-
-            if entity_area == area_id:
-                state = hass.states.get(entity.entity_id)
-                domain = entity.entity_id.split(".")[0]
+            state = get_state(entity_id)
+            domain = entity.domain
 
-                entities.append({
-                    "entity_id": entity.entity_id,
-                    "friendly_name": entity.name or entity.original_name or entity.entity_id,
-                    "domain": domain,
-                    "state": state.state if state else "unavailable",
-                })
+            entities.append({
+                "entity_id": entity.entity_id,
+                "friendly_name": entity.name or entity.original_name or entity.entity_id,
+                "domain": domain,
+                "state": state.state if state else "unavailable",
+            })
 
-                # Count by domain
-                entity_domains[domain] = entity_domains.get(domain, 0) + 1
+        entities.sort(key=itemgetter("entity_id"))
+        area_data["entities"] = entities
 
-        area_data["entities"] = sorted(entities, key=lambda x: x["entity_id"])
-        area_data["entity_summary"] = dict(sorted(entity_domains.items()))
+        # Count by domain. Entity IDs sort by domain first ("." sorts below
+        # any character a domain can contain), so counting the sorted list
+        # already yields the domains in order
+        area_data["entity_summary"] = dict(
+            Counter(entity["domain"] for entity in entities)
+        )
 
-        return self.json(area_data)
+        return _json_response(json_bytes(area_data))
 
 
 class FloorListView(HomeAssistantView):
@@ -212,37 +412,21 @@ class FloorListView(HomeAssistantView):
         """
         hass: HomeAssistant = request.app["hass"]
 
-        # Get registries
-        area_registry = ar.async_get(hass)
-        floor_registry = fr.async_get(hass)
+        # Nothing to aggregate without floors
+        if not fr.async_get(hass).async_list_floors():
+            return self.json([])
 
-        # Count areas per floor
-        floor_area_counts: dict[str, int] = {}
-        for area in area_registry.async_list_areas():
-            if area.floor_id:
-                floor_area_counts[area.floor_id] = floor_area_counts.get(area.floor_id, 0) + 1
-
-        floors = []
-        for floor in floor_registry.async_list_floors():
-            floors.append({
-                "id": floor.floor_id,
-                "name": floor.name,
-                "level": floor.level,
-                "icon": floor.icon,
-                "aliases": list(floor.aliases) if floor.aliases else [],
-                "area_count": floor_area_counts.get(floor.floor_id, 0),
-            })
-
-        # Sort by level
-        floors.sort(key=lambda x: (x.get("level") or 0, x["name"].lower()))
-
-        return self.json(floors)
+        aggregates = async_get_registry_data(hass, AREA_AGGREGATES)
+        body = aggregates.get_json(
+            ("floors", ""), lambda: _build_floor_list(hass, aggregates)
+        )
+        return _json_response(body)
 
 
 class FloorDetailView(HomeAssistantView):
     """View to get single floor details with areas."""
 
-    url = API_BASE_PATH_FLOORS + "/{floor_id}"
+    url = API_BASE_PATH_FLOOR_DETAIL
     name = "api:config_mcp:floor"
     requires_auth = True
 
@@ -260,8 +444,6 @@ class FloorDetailView(HomeAssistantView):
 
         # Get registries
         area_registry = ar.async_get(hass)
-        device_registry = dr.async_get(hass)
-        entity_registry = er.async_get(hass)
         floor_registry = fr.async_get(hass)
 
         # Get floor
@@ -273,22 +455,10 @@ class FloorDetailView(HomeAssistantView):
                 ERR_FLOOR_NOT_FOUND,
             )
 
-        # Count devices and entities per area
-        area_device_counts: dict[str, int] = {}
-        area_entity_counts: dict[str, int] = {}
-
-        for device in device_registry.devices.values():
-            if device.area_id and not device.disabled:
-                area_device_counts[device.area_id] = area_device_counts.get(device.area_id, 0) + 1
-
-        for entity in entity_registry.entities.values():
-            area_id = entity.area_id
-            if not area_id and entity.device_id:
-                device = device_registry.async_get(entity.device_id)
-                if device:
-                    area_id = device.area_id
-            if area_id and not entity.disabled:
-                area_entity_counts[area_id] = area_entity_counts.get(area_id, 0) + 1
+        # Devices and entities per area
+        aggregates = async_get_registry_data(hass, AREA_AGGREGATES)
+        area_device_counts = aggregates.area_device_counts
+        area_entity_counts = aggregates.area_entity_counts
 
         # Build floor data
         floor_data: dict[str, Any] = {
@@ -299,18 +469,19 @@ class FloorDetailView(HomeAssistantView):
             "aliases": list(floor.aliases) if floor.aliases else [],
         }
 
-        # Get areas on this floor
-        areas = []
+        # Get areas on this floor, as (sort key, area data) pairs
+        areas: list[tuple[str, dict[str, Any]]] = []
         for area in area_registry.async_list_areas():
             if area.floor_id == floor_id:
-                areas.append({
+                areas.append((area.name.lower(), {
                     "id": area.id,
                     "name": area.name,
                     "icon": area.icon,
                     "device_count": area_device_counts.get(area.id, 0),
                     "entity_count": area_entity_counts.get(area.id, 0),
-                })
+                }))
 
-        floor_data["areas"] = sorted(areas, key=lambda x: x["name"].lower())
+        areas.sort(key=itemgetter(0))
+        floor_data["areas"] = [area_data for _, area_data in areas]
 
-        return self.json(floor_data)
+        return _json_response(json_bytes(floor_data))
@@ -3,38 +3,332 @@
 from __future__ import annotations
 
 import logging
+from collections import Counter
+from collections.abc import Callable
+from functools import lru_cache
 from http import HTTPStatus
+from operator import itemgetter
 from typing import Any
+from urllib.parse import parse_qsl
 
 from aiohttp import web
 
 from homeassistant.components.http import HomeAssistantView
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONTENT_TYPE_JSON
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import area_registry as ar
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import floor_registry as fr
+from homeassistant.helpers.json import json_bytes
 
 from ..const import (
     API_BASE_PATH_DEVICES,
     ERR_DEVICE_NOT_FOUND,
 )
+from ..registry_cache import RegistryCacheSpec, async_get_registry_data
 
 _LOGGER = logging.getLogger(__name__)
 
+# Number of list items encoded per write when streaming a JSON array
+STREAM_BATCH_SIZE = 100
 
-def _get_device_data(
-    device: dr.DeviceEntry,
+# Request key under which the registries are cached
+REQUEST_REGISTRIES_KEY = "config_mcp_registries"
+
+
+def _build_entity_counts(
+    hass: HomeAssistant,
+) -> tuple[dict[str, int], dict[str, int]]:
+    """Count the entities per device and per integration.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        Tuple of (all entities per device ID, enabled entities per
+        integration platform)
+    """
+    entities = er.async_get(hass).entities.values()
+    device_counts = Counter(
+        entity.device_id for entity in entities if entity.device_id
+    )
+    platform_counts = Counter(
+        entity.platform for entity in entities if not entity.disabled
+    )
+    return device_counts, platform_counts
+
+
+# Entity counts, rebuilt after the entity registry changes
+ENTITY_COUNTS = RegistryCacheSpec(
+    "entity_counts", (er.EVENT_ENTITY_REGISTRY_UPDATED,), _build_entity_counts
+)
+
+
+@callback
+def async_get_entity_counts(
+    hass: HomeAssistant,
+) -> tuple[dict[str, int], dict[str, int]]:
+    """Get the cached entity counts per device and per integration.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        Tuple of (all entities per device ID, enabled entities per
+        integration platform)
+    """
+    return async_get_registry_data(hass, ENTITY_COUNTS)
+
+
+def _build_device_index(hass: HomeAssistant) -> tuple[list[str], dict[str, str]]:
+    """Order the devices by name and resolve the integration of each.
+
+    The order is by case-insensitive name. A device's integration is
+    resolved by _device_integration; devices without one are left out.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        Tuple of (sorted device IDs, integration per device ID)
+    """
+    devices = sorted(dr.async_get(hass).devices.values(), key=_device_sort_key)
+    integrations: dict[str, str] = {}
+    for device in devices:
+        integration = _device_integration(hass, device)
+        if integration is not None:
+            integrations[device.id] = integration
+    return [device.id for device in devices], integrations
+
+
+# Device order and integrations, rebuilt after the device registry changes
+DEVICE_INDEX = RegistryCacheSpec(
+    "device_index", (dr.EVENT_DEVICE_REGISTRY_UPDATED,), _build_device_index
+)
+
+
+@callback
+def async_get_sorted_devices(hass: HomeAssistant) -> list[dr.DeviceEntry]:
+    """Get the device registry entries sorted by case-insensitive name.
+
+    The order matches sorting the device data with _name_sort_key.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        List of device entries
+    """
+    device_ids = async_get_registry_data(hass, DEVICE_INDEX)[0]
+    get_device = dr.async_get(hass).devices.get
+    return [
+        device for device in map(get_device, device_ids) if device is not None
+    ]
+
+
+@callback
+def async_get_device_integrations(hass: HomeAssistant) -> dict[str, str]:
+    """Get the integration of every device that has one.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        Integration domain keyed by device ID
+    """
+    return async_get_registry_data(hass, DEVICE_INDEX)[1]
+
+
+async def _async_stream_json_list(
+    request: web.Request, items: list[dict[str, Any]]
+) -> web.StreamResponse:
+    """Stream a list as a JSON array, encoding it a batch of items at a time.
+
+    Large lists are never encoded into one buffer, and the client can start
+    reading before the last items are encoded.
+
+    Args:
+        request: The request being answered
+        items: The items of the array
+
+    Returns:
+        The finished response
+    """
+    response = web.StreamResponse()
+    response.content_type = CONTENT_TYPE_JSON
+    # Compress like HomeAssistantView.json does; it must be set before prepare
+    response.enable_compression()
+    await response.prepare(request)
+
+    if not items:
+        await response.write(b"[]")
+    else:
+        # Each batch is encoded as one array in a single encoder call; its
+        # brackets are swapped for the separators of the streamed array
+        opening = b"["
+        for start in range(0, len(items), STREAM_BATCH_SIZE):
+            encoded = json_bytes(items[start:start + STREAM_BATCH_SIZE])
+            await response.write(opening + encoded[1:-1])
+            opening = b","
+        await response.write(b"]")
+
+    await response.write_eof()
+    return response
+
+
+def _name_sort_key(data: dict[str, Any]) -> str:
+    """Sort key for response items by case-insensitive name, missing names first."""
+    name = data.get("name")
+    return name.lower() if name else ""
+
+
+def _device_sort_key(device: dr.DeviceEntry) -> str:
+    """Sort key for device entries matching _name_sort_key on their data."""
+    name = device.name_by_user or device.name
+    return name.lower() if name else ""
+
+
+@callback
+def _device_integration(hass: HomeAssistant, device: dr.DeviceEntry) -> str | None:
+    """Resolve the integration a device belongs to.
+
+    This is the domain of the device's first identifier (identifiers are
+    always (domain, id) tuples). Devices without identifiers fall back to
+    the domain of their primary config entry.
+
+    Args:
+        hass: Home Assistant instance
+        device: Device registry entry
+
+    Returns:
+        The integration domain, or None if it cannot be resolved
+    """
+    if device.identifiers:
+        return next(iter(device.identifiers))[0]
+    if device.primary_config_entry is not None:
+        entry = hass.config_entries.async_get_entry(device.primary_config_entry)
+        if entry is not None:
+            return entry.domain
+    return None
+
+
+def _device_has_integration(device: dr.DeviceEntry, domain: str) -> bool:
+    """Check whether any of a device's identifiers comes from an integration.
+
+    Most devices have a single identifier, which is compared directly
+    without setting up a generator.
+
+    Args:
+        device: Device registry entry
+        domain: Integration domain
+
+    Returns:
+        True if an identifier has that domain
+    """
+    identifiers = device.identifiers
+    if len(identifiers) == 1:
+        return next(iter(identifiers))[0] == domain
+    return any(identifier[0] == domain for identifier in identifiers)
+
+
+# Device list filters: (area, floor, integration, manufacturer, model,
+# include disabled)
+DeviceFilters = tuple[str | None, str | None, str | None, str | None, str | None, bool]
+
+
+@lru_cache(maxsize=128)
+def _parse_device_filters(query_string: str) -> DeviceFilters:
+    """Parse the device list filters from a query string.
+
+    Dashboards poll the same few URLs, so parsed filters are kept per
+    query string.
+
+    Args:
+        query_string: The still percent-encoded query string of the request
+
+    Returns:
+        The device list filters
+    """
+    # parse_qsl decodes the string once, "+" included, the way request.query
+    # does; reversed so the first value of a repeated parameter wins, as
+    # with request.query.get
+    query = dict(reversed(parse_qsl(query_string)))
+    return (
+        query.get("area"),
+        query.get("floor"),
+        query.get("integration"),
+        query.get("manufacturer"),
+        query.get("model"),
+        query.get("include_disabled", "false").lower() == "true",
+    )
+
+
+# Registries used by the device views
+Registries = tuple[
+    dr.DeviceRegistry, er.EntityRegistry, ar.AreaRegistry, fr.FloorRegistry
+]
+
+
+def _get_request_registries(request: web.Request) -> Registries:
+    """Get the device, entity, area and floor registries, once per request.
+
+    Args:
+        request: The incoming request
+
+    Returns:
+        Tuple of (device, entity, area, floor) registries
+    """
+    registries = request.get(REQUEST_REGISTRIES_KEY)
+    if registries is None:
+        hass: HomeAssistant = request.app["hass"]
+        registries = request[REQUEST_REGISTRIES_KEY] = (
+            dr.async_get(hass),
+            er.async_get(hass),
+            ar.async_get(hass),
+            fr.async_get(hass),
+        )
+    return registries
+
+
+# Area details per area ID: (area name, floor ID, floor name)
+AreaIndex = dict[str, tuple[str, str | None, str | None]]
+
+
+def _build_area_index(
     area_registry: ar.AreaRegistry,
     floor_registry: fr.FloorRegistry,
+) -> AreaIndex:
+    """Resolve the name and floor of every area once.
+
+    Args:
+        area_registry: Area registry
+        floor_registry: Floor registry
+
+    Returns:
+        Area name, floor ID and floor name keyed by area ID
+    """
+    floor_names = {
+        floor.floor_id: floor.name for floor in floor_registry.async_list_floors()
+    }
+    return {
+        area.id: (area.name, area.floor_id, floor_names.get(area.floor_id))
+        for area in area_registry.async_list_areas()
+    }
+
+
+def _get_device_data(
+    device: dr.DeviceEntry,
+    area_index: AreaIndex,
+    integration: str | None,
     entity_count: int | None = None,
 ) -> dict[str, Any]:
     """Build device data dictionary.
 
     Args:
         device: Device registry entry
-        area_registry: Area registry
-        floor_registry: Floor registry
+        area_index: Area details from _build_area_index
+        integration: The device's integration from _device_integration
         entity_count: Optional pre-computed entity count
 
     Returns:
@@ -60,26 +354,22 @@ def _get_device_data(
 
     # Add area and floor info
     if device.area_id:
-        area = area_registry.async_get_area(device.area_id)
-        if area:
-            data["area_name"] = area.name
-            data["floor_id"] = area.floor_id
-            if area.floor_id:
-                floor = floor_registry.async_get_floor(area.floor_id)
-                if floor:
-                    data["floor_name"] = floor.name
-
-    # Add integration info from identifiers
-    if device.identifiers:
-        # Get the first identifier's domain as the integration
-        for identifier in device.identifiers:
-            if isinstance(identifier, (tuple, list)) and len(identifier) >= 1:
-                data["integration"] = identifier[0]
-                break
-
-    # Add identifiers and connections
-    data["identifiers"] = [list(i) if isinstance(i, (tuple, list)) else [i] for i in device.identifiers] if device.identifiers else []
-    data["connections"] = [list(c) if isinstance(c, (tuple, list)) else [c] for c in device.connections] if device.connections else []
+        area_info = area_index.get(device.area_id)
+        if area_info:
+            area_name, floor_id, floor_name = area_info
+            data["area_name"] = area_name
+            data["floor_id"] = floor_id
+            if floor_name is not None:
+                data["floor_name"] = floor_name
+
+    # Add integration info
+    if integration is not None:
+        data["integration"] = integration
+
+    # Add identifiers and connections; both are sets of tuples, which
+    # encode as arrays just like lists do
+    data["identifiers"] = list(device.identifiers)
+    data["connections"] = list(device.connections)
 
     if entity_count is not None:
         data["entity_count"] = entity_count
@@ -113,7 +403,7 @@ def _get_full_device_data(
 
         entity_data = {
             "entity_id": entity_entry.entity_id,
-            "domain": entity_entry.entity_id.split(".")[0],
+            "domain": entity_entry.domain,
             "friendly_name": entity_entry.name or entity_entry.original_name or entity_entry.entity_id,
             "state": state.state if state else "unavailable",
             "device_class": entity_entry.device_class or entity_entry.original_device_class,
@@ -124,18 +414,121 @@ def _get_full_device_data(
         entities.append(entity_data)
 
     # Build device data
-    data = _get_device_data(device, area_registry, floor_registry, len(entities))
+    area_index = _build_area_index(area_registry, floor_registry)
+    # Resolve just this device rather than the whole device index
+    integration = _device_integration(hass, device)
+    data = _get_device_data(device, area_index, integration, len(entities))
 
     # Add config entry info
     if device.config_entries:
         data["config_entry_ids"] = list(device.config_entries)
 
     # Add entities
-    data["entities"] = sorted(entities, key=lambda x: x["entity_id"])
+    entities.sort(key=itemgetter("entity_id"))
+    data["entities"] = entities
 
     return data
 
 
+def _device_rejects(
+    area_index: AreaIndex,
+    area_filter: str | None,
+    floor_filter: str | None,
+    manufacturer_filter: str | None,
+    model_filter: str | None,
+) -> list[Callable[[dr.DeviceEntry], bool]]:
+    """Build a predicate for each given device filter.
+
+    Args:
+        area_index: Area details from _build_area_index
+        area_filter: Area ID to keep, if any
+        floor_filter: Floor ID to keep, if any
+        manufacturer_filter: Manufacturer to keep, if any
+        model_filter: Model to keep, if any
+
+    Returns:
+        Predicates that are true for devices the filters exclude
+    """
+    rejects: list[Callable[[dr.DeviceEntry], bool]] = []
+
+    if area_filter:
+        rejects.append(lambda device: device.area_id != area_filter)
+
+    if floor_filter:
+        # IDs of the areas on the wanted floor
+        floor_areas = {
+            area_id
+            for area_id, (_, floor_id, _) in area_index.items()
+            if floor_id == floor_filter
+        }
+        rejects.append(lambda device: device.area_id not in floor_areas)
+
+    if manufacturer_filter:
+        rejects.append(lambda device: device.manufacturer != manufacturer_filter)
+
+    if model_filter:
+        rejects.append(lambda device: device.model != model_filter)
+
+    return rejects
+
+
+def _build_device_list(
+    device_entries: list[dr.DeviceEntry],
+    area_index: AreaIndex,
+    device_entity_counts: dict[str, int],
+    device_integrations: dict[str, str],
+    rejects: list[Callable[[dr.DeviceEntry], bool]],
+    integration_filter: str | None,
+    include_disabled: bool,
+) -> list[dict[str, Any]]:
+    """Filter devices and build their data, keeping the order of the entries.
+
+    Args:
+        device_entries: The device registry entries, sorted
+        area_index: Area details from _build_area_index
+        device_entity_counts: Entities per device ID
+        device_integrations: Integration per device ID
+        rejects: Predicates from _device_rejects
+        integration_filter: Integration domain to keep, if any
+        include_disabled: Whether to keep disabled devices
+
+    Returns:
+        List of device data dictionaries
+    """
+    # Integration filter - narrow down to devices with an identifier
+    # from that domain before running the other filters
+    candidates = device_entries
+    if integration_filter:
+        candidates = [
+            device
+            for device in candidates
+            if _device_has_integration(device, integration_filter)
+        ]
+
+    devices: list[dict[str, Any]] = []
+    append = devices.append
+    get_entity_count = device_entity_counts.get
+    get_integration = device_integrations.get
+    for device in candidates:
+        # Skip disabled unless requested
+        if device.disabled and not include_disabled:
+            continue
+
+        if rejects and any(reject(device) for reject in rejects):
+            continue
+
+        # Build device data
+        device_id = device.id
+        append(_get_device_data(
+            device,
+            area_index,
+            get_integration(device_id),
+            get_entity_count(device_id, 0),
+        ))
+
+    return devices
+
+
 class DeviceListView(HomeAssistantView):
     """View to list all devices with optional filtering."""
 
@@ -143,7 +536,7 @@ class DeviceListView(HomeAssistantView):
     name = "api:config_mcp:devices"
     requires_auth = True
 
-    async def get(self, request: web.Request) -> web.Response:
+    async def get(self, request: web.Request) -> web.StreamResponse:
         """Handle GET request - list all devices.
 
         Query params:
@@ -160,79 +553,42 @@ class DeviceListView(HomeAssistantView):
         hass: HomeAssistant = request.app["hass"]
 
         # Get query parameters
-        area_filter = request.query.get("area")
-        floor_filter = request.query.get("floor")
-        integration_filter = request.query.get("integration")
-        manufacturer_filter = request.query.get("manufacturer")
-        model_filter = request.query.get("model")
-        include_disabled = request.query.get("include_disabled", "false").lower() == "true"
+        (
+            area_filter,
+            floor_filter,
+            integration_filter,
+            manufacturer_filter,
+            model_filter,
+            include_disabled,
+        ) = _parse_device_filters(request.rel_url.raw_query_string)
 
         # Get registries
-        device_registry = dr.async_get(hass)
-        entity_registry = er.async_get(hass)
-        area_registry = ar.async_get(hass)
-        floor_registry = fr.async_get(hass)
-
-        # Build area-to-floor mapping for floor filtering
-        area_to_floor: dict[str, str | None] = {}
-        if floor_filter:
-            for area in area_registry.async_list_areas():
-                area_to_floor[area.id] = area.floor_id
-
-        # Count entities per device
-        device_entity_counts: dict[str, int] = {}
-        for entity_entry in entity_registry.entities.values():
-            if entity_entry.device_id:
-                device_entity_counts[entity_entry.device_id] = (
-                    device_entity_counts.get(entity_entry.device_id, 0) + 1
-                )
-
-        devices = []
-        for device in device_registry.devices.values():
-            # Skip disabled unless requested
-            if device.disabled and not include_disabled:
-                continue
-
-            # Area filter
-            if area_filter and device.area_id != area_filter:
-                continue
-
-            # Floor filter
-            if floor_filter:
-                if not device.area_id:
-                    continue
-                device_floor = area_to_floor.get(device.area_id)
-                if device_floor != floor_filter:
-                    continue
-
-            # Manufacturer filter
-            if manufacturer_filter and device.manufacturer != manufacturer_filter:
-                continue
-
-            # Model filter
-            if model_filter and device.model != model_filter:
-                continue
-
-            # Integration filter - check identifiers
-            if integration_filter:
-                has_integration = False
-                for identifier in device.identifiers:
-                    if isinstance(identifier, (tuple, list)) and len(identifier) >= 1:
-                        if identifier[0] == integration_filter:
-                            has_integration = True
-                            break
-                if not has_integration:
-                    continue
-
-            # Build device data
-            entity_count = device_entity_counts.get(device.id, 0)
-            device_data = _get_device_data(device, area_registry, floor_registry, entity_count)
-            devices.append(device_data)
-
-        # Sort by name
-        devices.sort(key=lambda x: (x.get("name") or "").lower())
-
-        return self.json(devices)
+        _, _, area_registry, floor_registry = _get_request_registries(request)
+
+        # Resolve area and floor details once, for filtering and output
+        area_index = _build_area_index(area_registry, floor_registry)
+
+        # Entities per device
+        device_entity_counts = async_get_entity_counts(hass)[0]
+
+        # Only the filters that were given are checked per device
+        rejects = _device_rejects(
+            area_index, area_filter, floor_filter, manufacturer_filter, model_filter
+        )
+
+        # The cached device order is the response order, so the list
+        # needs no sorting
+        devices = _build_device_list(
+            async_get_sorted_devices(hass),
+            area_index,
+            device_entity_counts,
+            async_get_device_integrations(hass),
+            rejects,
+            integration_filter,
+            include_disabled,
+        )
+
+        return await _async_stream_json_list(request, devices)
 
 
 class DeviceDetailView(HomeAssistantView):
@@ -255,10 +611,12 @@ class DeviceDetailView(HomeAssistantView):
         hass: HomeAssistant = request.app["hass"]
 
         # Get registries
-        device_registry = dr.async_get(hass)
-        entity_registry = er.async_get(hass)
-        area_registry = ar.async_get(hass)
-        floor_registry = fr.async_get(hass)
+        (
+            device_registry,
+            entity_registry,
+            area_registry,
+            floor_registry,
+        ) = _get_request_registries(request)
 
         # Get device
         device = device_registry.async_get(device_id)
@@ -3,14 +3,23 @@
 from __future__ import annotations
 
 import logging
+import os
+import time
 import uuid
+from collections import ChainMap
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime
 from http import HTTPStatus
 from typing import Any
 
+import orjson
 from aiohttp import web
 
 from homeassistant.components.http import HomeAssistantView
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.storage import Store
 
 from ..const import (
@@ -19,6 +28,11 @@ from ..const import (
     CONF_HELPERS_DELETE,
     CONF_HELPERS_READ,
     CONF_HELPERS_UPDATE,
+    DATA_HELPER_DATA,
+    DATA_HELPER_PENDING_RELOADS,
+    DATA_HELPER_PENDING_SAVES,
+    DATA_HELPER_SAVE_TIMERS,
+    DATA_HELPER_STORES,
     DEFAULT_OPTIONS,
     DOMAIN,
     ERR_HELPER_INVALID_CONFIG,
@@ -33,19 +47,50 @@ _LOGGER = logging.getLogger(__name__)
 # Storage version must match Home Assistant's internal version for these domains
 STORAGE_VERSION = 1
 
+# Request key under which the resolved configuration options are cached
+REQUEST_OPTIONS_KEY = "config_mcp_options"
 
-def get_config_options(hass: HomeAssistant) -> dict[str, Any]:
-    """Get the current configuration options for config_mcp."""
-    options = DEFAULT_OPTIONS.copy()
+# Error message for unsupported helper domains, built once at import
+INVALID_DOMAIN_MESSAGE = "Invalid domain '{}'. Valid domains: " + ", ".join(HELPER_DOMAINS)
 
-    if DOMAIN in hass.data:
-        for entry_id, entry_data in hass.data[DOMAIN].items():
-            for entry in hass.config_entries.async_entries(DOMAIN):
-                if entry.entry_id == entry_id:
-                    options.update(entry.options)
-                    break
+# Seconds to wait before flushing helper changes, so bursts of edits share one write
+SAVE_DELAY = 1.0
 
-    return options
+# Seconds reads trust the cached helper data before checking whether the
+# storage file was changed outside this integration; writes always check
+MTIME_CHECK_INTERVAL = 5.0
+
+# Seconds to wait before reloading a helper domain, so bursts of edits share one
+# reload; the reload writes the domain's pending save first, so it may come
+# before SAVE_DELAY runs out
+RELOAD_DELAY = 0.5
+
+
+@dataclass
+class _CachedHelperData:
+    """Storage data of a helper domain, kept between requests."""
+
+    data: dict[str, Any]
+    # Modification time of the storage file the data matches, None if missing
+    mtime: int | None
+    # time.monotonic() of the last modification time check
+    checked_at: float
+
+
+def get_config_options(hass: HomeAssistant) -> Mapping[str, Any]:
+    """Get the current configuration options for config_mcp.
+
+    Returns a read-only view layering loaded entries' options over the
+    defaults, so nothing is copied per call.
+    """
+    loaded = hass.data.get(DOMAIN, {})
+    entry_options = [
+        entry.options
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.entry_id in loaded
+    ]
+    # ChainMap returns the first match, so the last entry must come first
+    return ChainMap(*reversed(entry_options), DEFAULT_OPTIONS)
 
 
 def check_permission(hass: HomeAssistant, permission: str) -> bool:
@@ -54,6 +99,256 @@ def check_permission(hass: HomeAssistant, permission: str) -> bool:
     return options.get(permission, False)
 
 
+def _get_request_options(request: web.Request) -> Mapping[str, Any]:
+    """Get the configuration options, resolved at most once per request.
+
+    Args:
+        request: The incoming request
+
+    Returns:
+        The merged configuration options
+    """
+    options = request.get(REQUEST_OPTIONS_KEY)
+    if options is None:
+        options = request[REQUEST_OPTIONS_KEY] = get_config_options(request.app["hass"])
+    return options
+
+
+def _sync_reload_requested(request: web.Request) -> bool:
+    """Check whether the caller asked to wait for the helper domain reload.
+
+    Args:
+        request: The incoming request
+
+    Returns:
+        True if the sync query param is set
+    """
+    return request.query.get("sync", "").lower() in ("1", "true")
+
+
+def _get_store(hass: HomeAssistant, domain: str) -> Store[dict[str, Any]]:
+    """Get the shared Store for a helper domain.
+
+    A single Store instance per domain is required so that delayed writes
+    coalesce and loads observe data that has not been flushed yet. The JSON
+    encoding is done in the executor, since domains with many helpers or long
+    input_select option lists can otherwise stall the event loop.
+
+    Args:
+        hass: Home Assistant instance
+        domain: The helper domain
+
+    Returns:
+        The Store for .storage/core.{domain}
+    """
+    stores: dict[str, Store[dict[str, Any]]] = hass.data.setdefault(DATA_HELPER_STORES, {})
+    store = stores.get(domain)
+    if store is None:
+        try:
+            store = Store(
+                hass, STORAGE_VERSION, f"core.{domain}", serialize_in_event_loop=False
+            )
+        except TypeError:
+            # Older Home Assistant versions always serialize in the executor
+            store = Store(hass, STORAGE_VERSION, f"core.{domain}")
+        stores[domain] = store
+    return store
+
+
+def _snapshot(data: dict[str, Any]) -> dict[str, Any]:
+    """Copy storage data so it can be encoded outside the event loop.
+
+    Helper items are replaced rather than mutated, so copying the items list
+    is enough to keep later writes from changing the data mid-encode.
+
+    Args:
+        data: The cached storage data
+
+    Returns:
+        A shallow copy of the data with its own items list
+    """
+    return {**data, "items": list(data["items"])}
+
+
+def _get_mtime(path: str) -> int | None:
+    """Get the modification time of a storage file.
+
+    Args:
+        path: Path of the storage file
+
+    Returns:
+        The modification time in nanoseconds, or None if the file is missing
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _schedule_save(hass: HomeAssistant, domain: str, data: dict[str, Any]) -> None:
+    """Schedule a delayed save of a helper domain's storage data.
+
+    Each call restarts the delay, so a burst of edits is written once.
+
+    Args:
+        hass: Home Assistant instance
+        domain: The helper domain
+        data: The full storage data, already updated in place
+    """
+    pending: dict[str, dict[str, Any]] = hass.data.setdefault(DATA_HELPER_PENDING_SAVES, {})
+    pending[domain] = data
+
+    timers: dict[str, Callable[[], None]] = hass.data.setdefault(DATA_HELPER_SAVE_TIMERS, {})
+    cancel = timers.pop(domain, None)
+    if cancel is not None:
+        cancel()
+
+    async def _async_save_later(_now: datetime) -> None:
+        timers.pop(domain, None)
+        await _async_flush_domain(hass, domain)
+
+    timers[domain] = async_call_later(hass, SAVE_DELAY, _async_save_later)
+
+
+async def _async_flush_saves(hass: HomeAssistant) -> None:
+    """Write every helper domain's pending save now.
+
+    Args:
+        hass: Home Assistant instance
+    """
+    for domain in list(hass.data.get(DATA_HELPER_PENDING_SAVES, {})):
+        await _async_flush_domain(hass, domain)
+
+
+async def flush_pending(hass: HomeAssistant) -> None:
+    """Write any helper changes still waiting on a delayed save.
+
+    Debounced reloads are cancelled and run right away, so none fires after
+    the config entry has unloaded.
+
+    Args:
+        hass: Home Assistant instance
+    """
+    pending_reloads: dict[str, Callable[[], None]] = hass.data.get(
+        DATA_HELPER_PENDING_RELOADS, {}
+    )
+    while pending_reloads:
+        domain, cancel = pending_reloads.popitem()
+        cancel()
+        # Writes the domain's pending save before reloading it
+        await _async_reload_domain(hass, domain)
+
+    await _async_flush_saves(hass)
+
+
+@callback
+def async_listen_final_write(hass: HomeAssistant) -> Callable[[], None]:
+    """Write pending helper saves when Home Assistant shuts down.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        Callback that stops listening
+    """
+
+    async def _async_final_write(_event: Event) -> None:
+        await _async_flush_saves(hass)
+
+    return hass.bus.async_listen(EVENT_HOMEASSISTANT_FINAL_WRITE, _async_final_write)
+
+
+async def _async_flush_domain(hass: HomeAssistant, domain: str) -> None:
+    """Write a helper domain's pending save now instead of after SAVE_DELAY.
+
+    The cache records the storage file's modification time after the save,
+    so the save is not mistaken for an outside edit. If the save fails, the
+    cached data no longer matches the file and is dropped, so the next use
+    loads whatever the file holds by then.
+
+    Args:
+        hass: Home Assistant instance
+        domain: The helper domain
+    """
+    timers: dict[str, Callable[[], None]] = hass.data.get(DATA_HELPER_SAVE_TIMERS, {})
+    cancel = timers.pop(domain, None)
+    if cancel is not None:
+        cancel()
+
+    pending: dict[str, dict[str, Any]] = hass.data.get(DATA_HELPER_PENDING_SAVES, {})
+    data = pending.get(domain)
+    if data is None:
+        return
+
+    store = _get_store(hass, domain)
+    cache: dict[str, _CachedHelperData] = hass.data.get(DATA_HELPER_DATA, {})
+    saved = False
+    try:
+        await store.async_save(_snapshot(data))
+        saved = True
+    except Exception as err:
+        _LOGGER.warning("Failed to flush pending %s helpers: %s", domain, err)
+    finally:
+        # Edits made during the save scheduled a new save of the whole data,
+        # which retries a failed one; until then it all stays pending
+        if domain not in timers:
+            pending.pop(domain, None)
+            if not saved:
+                cache.pop(domain, None)
+
+    if saved:
+        mtime = await hass.async_add_executor_job(_get_mtime, store.path)
+        cached = cache.get(domain)
+        if cached is not None and cached.data is data:
+            cached.mtime = mtime
+            cached.checked_at = time.monotonic()
+
+
+async def _async_reload_domain(hass: HomeAssistant, domain: str) -> None:
+    """Reload a helper domain so it picks up storage changes.
+
+    Any pending save of the domain is written first, so the reload reads
+    the changed file rather than the old one.
+
+    Args:
+        hass: Home Assistant instance
+        domain: The helper domain
+    """
+    await _async_flush_domain(hass, domain)
+    try:
+        await hass.services.async_call(domain, "reload", blocking=True)
+    except Exception as err:
+        _LOGGER.warning("Failed to reload %s after helper changes: %s", domain, err)
+
+
+async def _async_request_reload(
+    hass: HomeAssistant,
+    domain: str,
+    sync_reload: bool = False,
+) -> None:
+    """Reload a helper domain, debouncing unless a synchronous reload is requested.
+
+    Args:
+        hass: Home Assistant instance
+        domain: The helper domain
+        sync_reload: Reload now and wait for it instead of scheduling it
+    """
+    pending: dict[str, Callable[[], None]] = hass.data.setdefault(DATA_HELPER_PENDING_RELOADS, {})
+    cancel = pending.pop(domain, None)
+    if cancel is not None:
+        cancel()
+
+    if sync_reload:
+        await _async_reload_domain(hass, domain)
+        return
+
+    async def _async_reload_later(_now: datetime) -> None:
+        pending.pop(domain, None)
+        await _async_reload_domain(hass, domain)
+
+    pending[domain] = async_call_later(hass, RELOAD_DELAY, _async_reload_later)
+
+
 def _generate_helper_id(name: str) -> str:
     """Generate a helper ID from the name.
 
@@ -73,6 +368,108 @@ def _generate_helper_id(name: str) -> str:
     return helper_id or f"helper_{uuid.uuid4().hex[:8]}"
 
 
+async def _async_get_data(
+    hass: HomeAssistant,
+    domain: str,
+    for_write: bool = False,
+) -> dict[str, Any]:
+    """Get the in-memory storage data for a helper domain.
+
+    The data is loaded from .storage/core.{domain} on first use and then kept
+    in memory. Writes from this module mutate it in place. Home Assistant's
+    own helper collections write the same file, for example when a helper is
+    edited in the UI, so the cache is only reused while the file's
+    modification time matches the version it was loaded from or saved as.
+    Reads check that at most every MTIME_CHECK_INTERVAL seconds.
+
+    Args:
+        hass: Home Assistant instance
+        domain: The helper domain
+        for_write: The caller is about to change the data, so check the file
+            regardless of when it was last checked
+
+    Returns:
+        The storage data dict, always containing an "items" list of dicts
+    """
+    cache: dict[str, _CachedHelperData] = hass.data.setdefault(DATA_HELPER_DATA, {})
+    pending_saves: dict[str, dict[str, Any]] = hass.data.setdefault(
+        DATA_HELPER_PENDING_SAVES, {}
+    )
+
+    # Changes still waiting on a delayed save are newer than the file
+    cached = cache.get(domain)
+    if cached is not None and (
+        domain in pending_saves
+        or (not for_write and time.monotonic() - cached.checked_at < MTIME_CHECK_INTERVAL)
+    ):
+        return cached.data
+
+    store = _get_store(hass, domain)
+    mtime = await hass.async_add_executor_job(_get_mtime, store.path)
+    checked_at = time.monotonic()
+
+    cached = cache.get(domain)
+    if cached is not None:
+        if domain in pending_saves:
+            return cached.data
+        if mtime == cached.mtime:
+            cached.checked_at = checked_at
+            return cached.data
+        _LOGGER.debug("Reloading %s helpers changed outside this integration", domain)
+
+    loaded = await store.async_load() or {}
+
+    # Another request may have modified this domain while we were waiting on
+    # the store; its changes win over the loaded file
+    cached = cache.get(domain)
+    if cached is not None and domain in pending_saves:
+        return cached.data
+
+    # Drop malformed entries once here so every other function can iterate
+    # the items without re-checking them. Concurrent loads share the
+    # loaded dict, so it is copied rather than changed
+    data = {
+        **loaded,
+        "items": [item for item in loaded.get("items", ()) if isinstance(item, dict)],
+    }
+    cache[domain] = _CachedHelperData(data, mtime, checked_at)
+    return data
+
+
+def _to_response(item: dict[str, Any], domain: str) -> dict[str, Any]:
+    """Build the API representation of a stored helper.
+
+    Args:
+        item: The stored helper configuration
+        domain: The helper domain
+
+    Returns:
+        Helper data with id, name and domain first
+    """
+    return {
+        "id": item.get("id"),
+        "name": item.get("name"),
+        "domain": domain,
+        **{k: v for k, v in item.items() if k not in ("id", "name")},
+    }
+
+
+def _find_helper_index(items: list[dict[str, Any]], helper_id: str) -> int | None:
+    """Find the position of a helper in a domain's items.
+
+    Args:
+        items: The stored helper items
+        helper_id: The helper ID
+
+    Returns:
+        The index of the helper, or None if not found
+    """
+    for index, item in enumerate(items):
+        if item.get("id") == helper_id:
+            return index
+    return None
+
+
 async def _get_helpers_for_domain(hass: HomeAssistant, domain: str) -> list[dict[str, Any]]:
     """Get all helpers for a specific domain using the Store API.
 
@@ -83,28 +480,10 @@ async def _get_helpers_for_domain(hass: HomeAssistant, domain: str) -> list[dict
     Returns:
         List of helper configurations
     """
-    helpers = []
-
-    # Use Store API to read from .storage/core.{domain}
-    store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"core.{domain}")
-    data = await store.async_load()
-
-    if data is None:
-        return helpers
+    data = await _async_get_data(hass, domain)
 
     # The storage format has an "items" key containing the list of helpers
-    items = data.get("items", [])
-
-    for item in items:
-        if isinstance(item, dict):
-            helpers.append({
-                "id": item.get("id"),
-                "name": item.get("name"),
-                "domain": domain,
-                **{k: v for k, v in item.items() if k not in ("id", "name")},
-            })
-
-    return helpers
+    return [_to_response(item, domain) for item in data["items"]]
 
 
 async def _get_all_helpers(hass: HomeAssistant) -> list[dict[str, Any]]:
@@ -144,21 +523,11 @@ async def _get_helper_by_id(
     """
     for domain in HELPER_DOMAINS:
         try:
-            store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"core.{domain}")
-            data = await store.async_load()
-
-            if data is None:
-                continue
-
-            items = data.get("items", [])
-            for item in items:
-                if isinstance(item, dict) and item.get("id") == helper_id:
-                    return domain, {
-                        "id": item.get("id"),
-                        "name": item.get("name"),
-                        "domain": domain,
-                        **{k: v for k, v in item.items() if k not in ("id", "name")},
-                    }
+            items = (await _async_get_data(hass, domain))["items"]
+
+            index = _find_helper_index(items, helper_id)
+            if index is not None:
+                return domain, _to_response(items[index], domain)
         except Exception as err:
             _LOGGER.warning("Error searching for helper in domain %s: %s", domain, err)
             continue
@@ -170,6 +539,7 @@ async def _create_helper(
     hass: HomeAssistant,
     domain: str,
     config: dict[str, Any],
+    sync_reload: bool = False,
 ) -> dict[str, Any]:
     """Create a new helper using the Store API.
 
@@ -177,6 +547,7 @@ async def _create_helper(
         hass: Home Assistant instance
         domain: The helper domain
         config: The helper configuration
+        sync_reload: Wait for the domain reload instead of debouncing it
 
     Returns:
         The created helper data
@@ -187,16 +558,13 @@ async def _create_helper(
     if domain not in HELPER_DOMAINS:
         raise ValueError(f"Invalid helper domain: {domain}")
 
-    # Use Store API to read/write .storage/core.{domain}
-    store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"core.{domain}")
-    data = await store.async_load() or {"items": []}
+    data = await _async_get_data(hass, domain, for_write=True)
 
     # Generate ID from name if not provided
     helper_id = config.get("id") or _generate_helper_id(config["name"])
 
     # Check for duplicate ID
-    existing_ids = {item.get("id") for item in data.get("items", [])}
-    if helper_id in existing_ids:
+    if any(item.get("id") == helper_id for item in data["items"]):
         raise ValueError(f"Helper with ID '{helper_id}' already exists")
 
     # Build the helper configuration
@@ -206,25 +574,15 @@ async def _create_helper(
     }
 
     # Add to items list
-    if "items" not in data:
-        data["items"] = []
     data["items"].append(new_helper)
 
-    # Save to storage
-    await store.async_save(data)
+    # Save to storage (coalesced with other writes to this domain)
+    _schedule_save(hass, domain, data)
 
     # Reload the domain to pick up the new helper
-    try:
-        await hass.services.async_call(domain, "reload", blocking=True)
-    except Exception as err:
-        _LOGGER.warning("Failed to reload %s after creation: %s", domain, err)
+    await _async_request_reload(hass, domain, sync_reload)
 
-    return {
-        "id": helper_id,
-        "name": config.get("name"),
-        "domain": domain,
-        **{k: v for k, v in new_helper.items() if k not in ("id", "name")},
-    }
+    return _to_response(new_helper, domain)
 
 
 async def _update_helper(
@@ -232,6 +590,7 @@ async def _update_helper(
     domain: str,
     helper_id: str,
     updates: dict[str, Any],
+    sync_reload: bool = False,
 ) -> dict[str, Any]:
     """Update an existing helper using the Store API.
 
@@ -240,6 +599,7 @@ async def _update_helper(
         domain: The helper domain
         helper_id: The helper ID
         updates: The fields to update
+        sync_reload: Wait for the domain reload instead of debouncing it
 
     Returns:
         The updated helper data
@@ -247,49 +607,31 @@ async def _update_helper(
     Raises:
         ValueError: If update fails
     """
-    # Use Store API to read/write .storage/core.{domain}
-    store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"core.{domain}")
-    data = await store.async_load()
-
-    if data is None:
-        raise ValueError(f"Helper domain {domain} has no stored data")
-
-    items = data.get("items", [])
+    data = await _async_get_data(hass, domain, for_write=True)
+    items = data["items"]
 
-    # Find and update the helper
-    updated_item = None
-    for i, item in enumerate(items):
-        if isinstance(item, dict) and item.get("id") == helper_id:
-            # Merge updates with existing item (don't change id)
-            items[i] = {**item, **updates, "id": helper_id}
-            updated_item = items[i]
-            break
-
-    if updated_item is None:
+    # Find the helper in the cached items
+    index = _find_helper_index(items, helper_id)
+    if index is None:
         raise ValueError(f"Helper '{helper_id}' not found in {domain}")
 
-    # Save to storage
-    data["items"] = items
-    await store.async_save(data)
+    # Merge updates with existing item in place (don't change id)
+    updated_item = items[index] = {**items[index], **updates, "id": helper_id}
+
+    # Save to storage (coalesced with other writes to this domain)
+    _schedule_save(hass, domain, data)
 
     # Reload the domain to pick up the changes
-    try:
-        await hass.services.async_call(domain, "reload", blocking=True)
-    except Exception as err:
-        _LOGGER.warning("Failed to reload %s after update: %s", domain, err)
+    await _async_request_reload(hass, domain, sync_reload)
 
-    return {
-        "id": updated_item.get("id"),
-        "name": updated_item.get("name"),
-        "domain": domain,
-        **{k: v for k, v in updated_item.items() if k not in ("id", "name")},
-    }
+    return _to_response(updated_item, domain)
 
 
 async def _delete_helper(
     hass: HomeAssistant,
     domain: str,
     helper_id: str,
+    sync_reload: bool = False,
 ) -> None:
     """Delete a helper using the Store API.
 
@@ -297,35 +639,27 @@ async def _delete_helper(
         hass: Home Assistant instance
         domain: The helper domain
         helper_id: The helper ID
+        sync_reload: Wait for the domain reload instead of debouncing it
 
     Raises:
         ValueError: If deletion fails
     """
-    # Use Store API to read/write .storage/core.{domain}
-    store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"core.{domain}")
-    data = await store.async_load()
-
-    if data is None:
-        raise ValueError(f"Helper domain {domain} has no stored data")
-
-    items = data.get("items", [])
+    data = await _async_get_data(hass, domain, for_write=True)
+    items = data["items"]
 
     # Find and remove the helper
     original_count = len(items)
-    items = [item for item in items if not (isinstance(item, dict) and item.get("id") == helper_id)]
+    items = [item for item in items if item.get("id") != helper_id]
 
     if len(items) == original_count:
         raise ValueError(f"Helper '{helper_id}' not found in {domain}")
 
-    # Save to storage
+    # Save to storage (coalesced with other writes to this domain)
     data["items"] = items
-    await store.async_save(data)
+    _schedule_save(hass, domain, data)
 
     # Reload the domain to pick up the changes
-    try:
-        await hass.services.async_call(domain, "reload", blocking=True)
-    except Exception as err:
-        _LOGGER.warning("Failed to reload %s after deletion: %s", domain, err)
+    await _async_request_reload(hass, domain, sync_reload)
 
 
 class HelperListView(HomeAssistantView):
@@ -348,7 +682,7 @@ class HelperListView(HomeAssistantView):
         """
         hass: HomeAssistant = request.app["hass"]
 
-        if not check_permission(hass, CONF_HELPERS_READ):
+        if not _get_request_options(request).get(CONF_HELPERS_READ, False):
             return self.json_message(
                 "Helper read permission is disabled",
                 HTTPStatus.FORBIDDEN,
@@ -359,7 +693,7 @@ class HelperListView(HomeAssistantView):
 
         if domain_filter is not None and domain_filter not in HELPER_DOMAINS:
             return self.json_message(
-                f"Invalid domain '{domain_filter}'. Valid domains: {', '.join(HELPER_DOMAINS)}",
+                INVALID_DOMAIN_MESSAGE.format(domain_filter),
                 HTTPStatus.BAD_REQUEST,
                 ERR_HELPER_INVALID_DOMAIN,
             )
@@ -399,6 +733,9 @@ class HelperListView(HomeAssistantView):
             counter: initial, step, minimum, maximum, icon (optional)
             timer: duration, icon (optional)
 
+        Query params:
+            sync: Set to 1 to wait for the helper domain reload before responding
+
         Returns:
             201: Helper created
             400: Invalid request or domain
@@ -407,7 +744,7 @@ class HelperListView(HomeAssistantView):
         """
         hass: HomeAssistant = request.app["hass"]
 
-        if not check_permission(hass, CONF_HELPERS_CREATE):
+        if not _get_request_options(request).get(CONF_HELPERS_CREATE, False):
             return self.json_message(
                 "Helper create permission is disabled",
                 HTTPStatus.FORBIDDEN,
@@ -421,8 +758,8 @@ class HelperListView(HomeAssistantView):
             )
 
         try:
-            body = await request.json()
-        except ValueError:
+            body = orjson.loads(await request.read())
+        except orjson.JSONDecodeError:
             return self.json_message(
                 "Invalid JSON in request body",
                 HTTPStatus.BAD_REQUEST,
@@ -447,7 +784,7 @@ class HelperListView(HomeAssistantView):
         domain = body["domain"]
         if domain not in HELPER_DOMAINS:
             return self.json_message(
-                f"Invalid domain '{domain}'. Valid domains: {', '.join(HELPER_DOMAINS)}",
+                INVALID_DOMAIN_MESSAGE.format(domain),
                 HTTPStatus.BAD_REQUEST,
                 ERR_HELPER_INVALID_DOMAIN,
             )
@@ -456,7 +793,9 @@ class HelperListView(HomeAssistantView):
         config = {k: v for k, v in body.items() if k != "domain"}
 
         try:
-            created = await _create_helper(hass, domain, config)
+            created = await _create_helper(
+                hass, domain, config, _sync_reload_requested(request)
+            )
         except ValueError as err:
             return self.json_message(
                 str(err),
@@ -501,7 +840,7 @@ class HelperDetailView(HomeAssistantView):
         """
         hass: HomeAssistant = request.app["hass"]
 
-        if not check_permission(hass, CONF_HELPERS_READ):
+        if not _get_request_options(request).get(CONF_HELPERS_READ, False):
             return self.json_message(
                 "Helper read permission is disabled",
                 HTTPStatus.FORBIDDEN,
@@ -539,6 +878,9 @@ class HelperDetailView(HomeAssistantView):
                 ... domain-specific fields ...
             }
 
+        Query params:
+            sync: Set to 1 to wait for the helper domain reload before responding
+
         Returns:
             200: Helper updated
             400: Invalid request
@@ -548,7 +890,7 @@ class HelperDetailView(HomeAssistantView):
         """
         hass: HomeAssistant = request.app["hass"]
 
-        if not check_permission(hass, CONF_HELPERS_UPDATE):
+        if not _get_request_options(request).get(CONF_HELPERS_UPDATE, False):
             return self.json_message(
                 "Helper update permission is disabled",
                 HTTPStatus.FORBIDDEN,
@@ -562,8 +904,8 @@ class HelperDetailView(HomeAssistantView):
             )
 
         try:
-            body = await request.json()
-        except ValueError:
+            body = orjson.loads(await request.read())
+        except orjson.JSONDecodeError:
             return self.json_message(
                 "Invalid JSON in request body",
                 HTTPStatus.BAD_REQUEST,
@@ -598,7 +940,9 @@ class HelperDetailView(HomeAssistantView):
         updates = {k: v for k, v in body.items() if k != "domain"}
 
         try:
-            updated = await _update_helper(hass, domain, helper_id, updates)
+            updated = await _update_helper(
+                hass, domain, helper_id, updates, _sync_reload_requested(request)
+            )
         except ValueError as err:
             return self.json_message(
                 str(err),
@@ -625,6 +969,9 @@ class HelperDetailView(HomeAssistantView):
         Path params:
             helper_id: The helper ID
 
+        Query params:
+            sync: Set to 1 to wait for the helper domain reload before responding
+
         Returns:
             204: Helper deleted
             401: Not authorized
@@ -633,7 +980,7 @@ class HelperDetailView(HomeAssistantView):
         """
         hass: HomeAssistant = request.app["hass"]
 
-        if not check_permission(hass, CONF_HELPERS_DELETE):
+        if not _get_request_options(request).get(CONF_HELPERS_DELETE, False):
             return self.json_message(
                 "Helper delete permission is disabled",
                 HTTPStatus.FORBIDDEN,
@@ -664,7 +1011,9 @@ class HelperDetailView(HomeAssistantView):
             )
 
         try:
-            await _delete_helper(hass, domain, helper_id)
+            await _delete_helper(
+                hass, domain, helper_id, _sync_reload_requested(request)
+            )
         except ValueError as err:
             return self.json_message(
                 str(err),
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import logging
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterable
 from http import HTTPStatus
 from typing import Any
 
@@ -16,6 +19,14 @@ from homeassistant.loader import async_get_integrations
 
 from ..const import (
     API_BASE_PATH_INTEGRATIONS,
+    DATA_INTEGRATION_NAMES,
+)
+from .devices import (
+    _async_stream_json_list,
+    _device_has_integration,
+    _name_sort_key,
+    async_get_device_integrations,
+    async_get_entity_counts,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -23,6 +34,76 @@ _LOGGER = logging.getLogger(__name__)
 # Error code
 ERR_INTEGRATION_NOT_FOUND = "integration_not_found"
 
+# Seconds a resolved integration name is reused before asking the loader again
+INTEGRATION_NAME_TTL = 60
+
+
+async def _async_get_integration_names(
+    hass: HomeAssistant, domains: list[str]
+) -> dict[str, str]:
+    """Get the display names of integrations, reusing recent lookups.
+
+    Names resolved within INTEGRATION_NAME_TTL seconds are served from
+    hass.data; only the remaining domains go to the integration loader.
+    Domains the loader cannot resolve are left out and not cached, so
+    they are retried on the next call.
+
+    Args:
+        hass: Home Assistant instance
+        domains: Integration domains to name
+
+    Returns:
+        Integration name keyed by domain, for the domains that resolved
+    """
+    cache: dict[str, tuple[float, str]] = hass.data.setdefault(
+        DATA_INTEGRATION_NAMES, {}
+    )
+    now = time.monotonic()
+
+    names: dict[str, str] = {}
+    missing: list[str] = []
+    for domain in domains:
+        cached = cache.get(domain)
+        if cached is not None and now - cached[0] < INTEGRATION_NAME_TTL:
+            names[domain] = cached[1]
+        else:
+            missing.append(domain)
+
+    if missing:
+        for domain, integration in (
+            await async_get_integrations(hass, missing)
+        ).items():
+            if isinstance(integration, Exception):
+                continue
+            names[domain] = integration.name
+            cache[domain] = (now, integration.name)
+
+    return names
+
+
+def _count_devices_per_integration(
+    device_entries: Iterable[dr.DeviceEntry],
+    device_integrations: dict[str, str],
+) -> dict[str, int]:
+    """Count enabled devices per integration in one pass.
+
+    Args:
+        device_entries: The device registry entries
+        device_integrations: Integration per device ID
+
+    Returns:
+        Device count keyed by integration domain
+    """
+    domain_device_counts: defaultdict[str, int] = defaultdict(int)
+    get_integration = device_integrations.get
+    for device in device_entries:
+        if device.disabled:
+            continue
+        integration = get_integration(device.id)
+        if integration is not None:
+            domain_device_counts[integration] += 1
+    return domain_device_counts
+
 
 class IntegrationListView(HomeAssistantView):
     """View to list all active integrations."""
@@ -31,7 +112,7 @@ class IntegrationListView(HomeAssistantView):
     name = "api:config_mcp:integrations"
     requires_auth = True
 
-    async def get(self, request: web.Request) -> web.Response:
+    async def get(self, request: web.Request) -> web.StreamResponse:
         """Handle GET request - list all active integrations.
 
         Returns:
@@ -39,40 +120,25 @@ class IntegrationListView(HomeAssistantView):
         """
         hass: HomeAssistant = request.app["hass"]
 
-        # Get registries
         device_registry = dr.async_get(hass)
-        entity_registry = er.async_get(hass)
 
         # Get all config entries grouped by domain
-        domain_entries: dict[str, list] = {}
+        domain_entries: defaultdict[str, list] = defaultdict(list)
         for entry in hass.config_entries.async_entries():
-            if entry.domain not in domain_entries:
-                domain_entries[entry.domain] = []
             domain_entries[entry.domain].append(entry)
 
-        # Count devices per integration
-        domain_device_counts: dict[str, int] = {}
-        for device in device_registry.devices.values():
-            if device.disabled:
-                continue
-            # Get integration from identifiers
-            for identifier in device.identifiers:
-                if isinstance(identifier, (tuple, list)) and len(identifier) >= 1:
-                    domain = identifier[0]
-                    domain_device_counts[domain] = domain_device_counts.get(domain, 0) + 1
-                    break
-
-        # Count entities per integration (by platform)
-        domain_entity_counts: dict[str, int] = {}
-        for entity in entity_registry.entities.values():
-            if entity.disabled:
-                continue
-            platform = entity.platform
-            domain_entity_counts[platform] = domain_entity_counts.get(platform, 0) + 1
+        # Count devices per integration straight from the registry
+        domain_device_counts = _count_devices_per_integration(
+            device_registry.devices.values(), async_get_device_integrations(hass)
+        )
 
-        # Get integration info
-        integration_domains = list(domain_entries.keys())
-        integrations_info = await async_get_integrations(hass, integration_domains)
+        # Entities per integration (by platform)
+        domain_entity_counts = async_get_entity_counts(hass)[1]
+
+        # Get integration names
+        integration_names = await _async_get_integration_names(
+            hass, list(domain_entries)
+        )
 
         integrations = []
         for domain, entries in sorted(domain_entries.items()):
@@ -86,10 +152,8 @@ class IntegrationListView(HomeAssistantView):
                 overall_state = states[0] if states else "unknown"
 
             # Get integration name from loader
-            integration_info = integrations_info.get(domain)
-            if integration_info and not isinstance(integration_info, Exception):
-                name = integration_info.name
-            else:
+            name = integration_names.get(domain)
+            if name is None:
                 name = domain.replace("_", " ").title()
 
             integrations.append({
@@ -102,9 +166,9 @@ class IntegrationListView(HomeAssistantView):
             })
 
         # Sort by name
-        integrations.sort(key=lambda x: x["name"].lower())
+        integrations.sort(key=_name_sort_key)
 
-        return self.json(integrations)
+        return await _async_stream_json_list(request, integrations)
 
 
 class IntegrationDetailView(HomeAssistantView):
@@ -140,11 +204,9 @@ class IntegrationDetailView(HomeAssistantView):
         entity_registry = er.async_get(hass)
 
         # Get integration info
-        integrations_info = await async_get_integrations(hass, [domain])
-        integration_info = integrations_info.get(domain)
+        name = (await _async_get_integration_names(hass, [domain])).get(domain)
 
-        if integration_info and not isinstance(integration_info, Exception):
-            name = integration_info.name
+        if name is not None:
             documentation = f"https://www.home-assistant.io/integrations/{domain}"
         else:
             name = domain.replace("_", " ").title()
@@ -168,13 +230,7 @@ class IntegrationDetailView(HomeAssistantView):
             if device.disabled:
                 continue
             # Check if device belongs to this integration
-            is_this_integration = False
-            for identifier in device.identifiers:
-                if isinstance(identifier, (tuple, list)) and len(identifier) >= 1:
-                    if identifier[0] == domain:
-                        is_this_integration = True
-                        break
-            if is_this_integration:
+            if _device_has_integration(device, domain):
                 devices.append({
                     "id": device.id,
                     "name": device.name_by_user or device.name,
@@ -182,13 +238,11 @@ class IntegrationDetailView(HomeAssistantView):
                 })
 
         # Count entities by domain for this integration
-        entity_domains: dict[str, int] = {}
-        for entity in entity_registry.entities.values():
-            if entity.disabled:
-                continue
-            if entity.platform == domain:
-                entity_domain = entity.entity_id.split(".")[0]
-                entity_domains[entity_domain] = entity_domains.get(entity_domain, 0) + 1
+        entity_domains = Counter(
+            entity.domain
+            for entity in entity_registry.entities.values()
+            if entity.platform == domain and not entity.disabled
+        )
 
         # Build response
         integration_data: dict[str, Any] = {
@@ -196,7 +250,7 @@ class IntegrationDetailView(HomeAssistantView):
             "name": name,
             "documentation": documentation,
             "config_entries": config_entries_data,
-            "devices": sorted(devices, key=lambda x: (x.get("name") or "").lower()),
+            "devices": sorted(devices, key=_name_sort_key),
             "entity_domains": dict(sorted(entity_domains.items())),
             "device_count": len(devices),
             "entity_count": sum(entity_domains.values()),
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping
+import time
+from collections.abc import Callable, Iterable, Mapping, Reversible, Sequence
 from datetime import datetime
 from http import HTTPStatus
+from types import MappingProxyType
 from typing import Any
 
 from aiohttp import web
@@ -21,6 +23,37 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_LOG_LIMIT = 100
 MAX_LOG_LIMIT = 1000
 
+# Log level names accepted by the level filter
+LEVEL_MAP: Mapping[str, int] = MappingProxyType({
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+})
+
+# Level numbers keyed by the record level names stored by system_log (e.g. "ERROR")
+_LEVEL_NUMBERS: Mapping[str, int] = MappingProxyType(
+    {name.upper(): level for name, level in LEVEL_MAP.items()}
+)
+
+# Formats record exceptions the same way Home Assistant's log formatter does
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+RecordsGetter = Callable[[Any], Iterable[Any]]
+
+# How to read records from system_log, resolved on first use
+_RECORDS_GETTER: RecordsGetter | None = None
+
+
+class InvalidLogQueryError(ValueError):
+    """Raised when a log query parameter cannot be parsed."""
+
+    def __init__(self, message: str, code: str) -> None:
+        """Initialize exception."""
+        super().__init__(message)
+        self.code = code
+
 
 class LogListView(HomeAssistantView):
     """View to list recent log entries."""
@@ -40,25 +73,16 @@ class LogListView(HomeAssistantView):
 
         Returns:
             200: JSON array of log entries
+            400: Invalid level, limit or since parameter
         """
         hass: HomeAssistant = request.app["hass"]
 
-        # Parse query parameters
-        level_filter = request.query.get("level", "").lower()
-        source_filter = request.query.get("source", "").lower()
-        limit = min(int(request.query.get("limit", DEFAULT_LOG_LIMIT)), MAX_LOG_LIMIT)
-        since_str = request.query.get("since")
-
-        since_dt = None
-        if since_str:
-            try:
-                since_dt = datetime.fromisoformat(since_str.replace("Z", "+00:00"))
-            except ValueError:
-                return self.json_message(
-                    "Invalid 'since' timestamp format. Use ISO format.",
-                    HTTPStatus.BAD_REQUEST,
-                    "invalid_timestamp",
-                )
+        try:
+            level_filter, source_filter, limit, since_ts = _parse_log_params(
+                request.query
+            )
+        except InvalidLogQueryError as err:
+            return self.json_message(str(err), HTTPStatus.BAD_REQUEST, err.code)
 
         # Get system log entries
         entries = await _get_log_entries(
@@ -66,7 +90,7 @@ class LogListView(HomeAssistantView):
             level_filter=level_filter,
             source_filter=source_filter,
             limit=limit,
-            since=since_dt,
+            since_ts=since_ts,
         )
 
         return self.json({
@@ -92,24 +116,16 @@ class LogErrorsView(HomeAssistantView):
 
         Returns:
             200: JSON array of error/warning log entries
+            400: Invalid limit or since parameter
         """
         hass: HomeAssistant = request.app["hass"]
 
-        # Parse query parameters
-        source_filter = request.query.get("source", "").lower()
-        limit = min(int(request.query.get("limit", DEFAULT_LOG_LIMIT)), MAX_LOG_LIMIT)
-        since_str = request.query.get("since")
-
-        since_dt = None
-        if since_str:
-            try:
-                since_dt = datetime.fromisoformat(since_str.replace("Z", "+00:00"))
-            except ValueError:
-                return self.json_message(
-                    "Invalid 'since' timestamp format. Use ISO format.",
-                    HTTPStatus.BAD_REQUEST,
-                    "invalid_timestamp",
-                )
+        try:
+            _, source_filter, limit, since_ts = _parse_log_params(
+                request.query, with_level=False
+            )
+        except InvalidLogQueryError as err:
+            return self.json_message(str(err), HTTPStatus.BAD_REQUEST, err.code)
 
         # Get error/warning entries
         entries = await _get_log_entries(
@@ -117,7 +133,7 @@ class LogErrorsView(HomeAssistantView):
             level_filter=None,
             source_filter=source_filter,
             limit=limit,
-            since=since_dt,
+            since_ts=since_ts,
             errors_only=True,
         )
 
@@ -127,12 +143,150 @@ class LogErrorsView(HomeAssistantView):
         })
 
 
+def _resolve_records_getter(system_log: Any) -> RecordsGetter | None:
+    """Work out how to read the records held by the system_log integration.
+
+    Args:
+        system_log: The system_log entry in hass.data
+
+    Returns:
+        A function returning the records oldest first, or None if no
+        record store could be found
+    """
+    # The system_log handler stores entries in a DedupStore (OrderedDict)
+    if hasattr(system_log, "records"):
+        if hasattr(system_log.records, "values"):
+            return lambda log: log.records.values()
+        return lambda log: log.records
+
+    if isinstance(system_log, Mapping) and "records" in system_log:
+        if hasattr(system_log["records"], "values"):
+            return lambda log: log["records"].values()
+        return lambda log: log["records"]
+
+    # Try to get from the handler directly
+    for handler in logging.root.handlers:
+        if hasattr(handler, "records"):
+            store = handler.records
+            if hasattr(store, "values"):
+                return lambda _log: store.values()
+            return lambda _log: store
+
+    return None
+
+
+def _get_records(system_log: Any) -> Iterable[Any]:
+    """Get the records held by the system_log integration, oldest first.
+
+    The way to reach the record store is probed once and then reused, and
+    only probed again if it stops working.
+
+    Args:
+        system_log: The system_log entry in hass.data
+
+    Returns:
+        The stored records
+    """
+    global _RECORDS_GETTER
+
+    if _RECORDS_GETTER is not None:
+        try:
+            return _RECORDS_GETTER(system_log)
+        except (AttributeError, KeyError):
+            _RECORDS_GETTER = None
+
+    getter = _resolve_records_getter(system_log)
+    if getter is None:
+        return ()
+    _RECORDS_GETTER = getter
+    return getter(system_log)
+
+
+def _parse_log_params(
+    query: Mapping[str, str], with_level: bool = True
+) -> tuple[str, str, int, float | None]:
+    """Parse and validate the query parameters of the log views.
+
+    Args:
+        query: The request query parameters
+        with_level: Whether the 'level' parameter is read
+
+    Returns:
+        Tuple of (level filter, source filter, limit, since timestamp);
+        the filters are lowercase and empty when not given
+
+    Raises:
+        InvalidLogQueryError: If a parameter is invalid
+    """
+    level_filter = query.get("level", "").lower() if with_level else ""
+    if level_filter and level_filter not in LEVEL_MAP:
+        raise InvalidLogQueryError(
+            f"Invalid level '{level_filter}'. Valid levels: {', '.join(LEVEL_MAP)}",
+            "invalid_level",
+        )
+
+    try:
+        limit = min(int(query.get("limit", DEFAULT_LOG_LIMIT)), MAX_LOG_LIMIT)
+    except ValueError:
+        raise InvalidLogQueryError(
+            "Invalid 'limit'. Use an integer.", "invalid_limit"
+        ) from None
+
+    try:
+        since_ts = _parse_since(query.get("since"))
+    except ValueError:
+        raise InvalidLogQueryError(
+            "Invalid 'since' timestamp format. Use ISO format.", "invalid_timestamp"
+        ) from None
+
+    return level_filter, query.get("source", "").lower(), limit, since_ts
+
+
+def _parse_since(value: str | None) -> float | None:
+    """Parse an ISO 'since' timestamp into a Unix timestamp.
+
+    Filtering compares this float directly against record times, so no
+    datetime is built per record. A trailing 'Z' is accepted as UTC.
+
+    Args:
+        value: ISO 8601 timestamp, or None/empty for no filter
+
+    Returns:
+        The Unix timestamp, or None if no value was given
+
+    Raises:
+        ValueError: If the value is not a valid ISO timestamp
+    """
+    if not value:
+        return None
+    return datetime.fromisoformat(value).timestamp()
+
+
+def _record_timestamp(record: Any) -> float | None:
+    """Get the Unix time of a log record.
+
+    Args:
+        record: A logging.LogRecord or system_log LogEntry
+
+    Returns:
+        The Unix timestamp, or None if the record carries no usable time
+    """
+    if isinstance(record, logging.LogRecord):
+        return record.created
+    raw_ts = getattr(record, "timestamp", None)
+    if isinstance(raw_ts, (int, float)):
+        return raw_ts
+    if isinstance(raw_ts, datetime):
+        return raw_ts.timestamp()
+    return None
+
+
 async def _get_log_entries(
     hass: HomeAssistant,
     level_filter: str | None = None,
     source_filter: str | None = None,
     limit: int = DEFAULT_LOG_LIMIT,
-    since: datetime | None = None,
+    since_ts: float | None = None,
     errors_only: bool = False,
 ) -> list[dict[str, Any]]:
     """Get log entries from the system log.
@@ -142,7 +296,7 @@ async def _get_log_entries(
         level_filter: Filter by specific log level
         source_filter: Filter by source (substring match)
         limit: Maximum entries to return
-        since: Only entries after this timestamp
+        since_ts: Only entries at or after this Unix timestamp
         errors_only: If True, only return warning/error/critical
 
     Returns:
@@ -155,110 +309,47 @@ async def _get_log_entries(
         from homeassistant.components.system_log import DOMAIN as SYSTEM_LOG_DOMAIN
 
         if SYSTEM_LOG_DOMAIN in hass.data:
-            system_log = hass.data[SYSTEM_LOG_DOMAIN]
-
-            # The system_log handler stores entries in a DedupStore (OrderedDict)
-            # Access via .records.to_list() or .records.values()
-            if hasattr(system_log, "records"):
-                store = system_log.records
-                if hasattr(store, "to_list"):
-                    # to_list() returns dicts, but we need the values for filtering
-                    records = list(store.values())
-                elif hasattr(store, "values"):
-                    records = list(store.values())
-                else:
-                    records = list(store)
-            elif isinstance(system_log, Mapping) and "records" in system_log:
-                records = list(system_log["records"].values() if hasattr(system_log["records"], "values") else system_log["records"])
+            records = _get_records(hass.data[SYSTEM_LOG_DOMAIN])
+            if not isinstance(records, Reversible):
+                records = list(records)
+            newest = next(reversed(records), None)
+
+            if newest is None or limit <= 0:
+                return entries
+
+            # Polling clients usually ask for entries since the last one they
+            # saw; when even the newest record is older, nothing can match
+            if since_ts:
+                newest_ts = _record_timestamp(newest)
+                if newest_ts is not None and newest_ts < since_ts:
+                    return entries
+
+            # Resolve the filters once, as numbers, before walking the records
+            target_level = LEVEL_MAP.get(level_filter.lower()) if level_filter else None
+            min_level = logging.WARNING if errors_only else 0
+            source_filter = source_filter.lower() if source_filter else None
+            if target_level and target_level < min_level:
+                # The requested level is below the minimum, nothing can match
+                return entries
+
+            # A store only ever holds one record type, so pick the loop once:
+            # - logging.LogRecord: has levelno (int), levelname, getMessage(), created, exc_info
+            # - HA LogEntry: has level (str), name, message (deque), timestamp, exception
+            if isinstance(newest, logging.LogRecord):
+                collect = _collect_log_records
+            elif hasattr(newest, "level") and hasattr(newest, "message"):
+                collect = _collect_system_log_entries
             else:
-                # Try to get from the handler directly
-                records = []
-                for handler in logging.root.handlers:
-                    if hasattr(handler, "records"):
-                        store = handler.records
-                        if hasattr(store, "values"):
-                            records = list(store.values())
-                        else:
-                            records = list(store)
-                        break
-
-            # Level mapping
-            level_map = {
-                "debug": logging.DEBUG,
-                "info": logging.INFO,
-                "warning": logging.WARNING,
-                "error": logging.ERROR,
-                "critical": logging.CRITICAL,
-            }
-
-            for record in reversed(records):
-                if len(entries) >= limit:
-                    break
-
-                # Handle different record types:
-                # - logging.LogRecord: has levelno (int), levelname, getMessage(), created, exc_info
-                # - HA LogEntry: has level (str), name, message (deque), timestamp, exception
-                if hasattr(record, "levelno"):
-                    # logging.LogRecord format
-                    level_no = record.levelno
-                    level_name = record.levelname
-                    source = record.name
-                    message = record.getMessage()
-                    timestamp = datetime.fromtimestamp(record.created)
-                    exc_text = None
-                    if record.exc_info:
-                        import traceback
-                        exc_text = "".join(traceback.format_exception(*record.exc_info))
-                elif hasattr(record, "level") and hasattr(record, "message"):
-                    # Home Assistant LogEntry format (from system_log)
-                    level_name = record.level
-                    level_no = level_map.get(level_name.lower(), 0)
-                    source = record.name
-                    # message is a deque of strings, join them
-                    if hasattr(record.message, "__iter__") and not isinstance(record.message, str):
-                        message = " | ".join(str(m) for m in record.message)
-                    else:
-                        message = str(record.message)
-                    # timestamp may be a float (unix timestamp) or datetime
-                    raw_ts = record.timestamp if hasattr(record, "timestamp") else None
-                    if isinstance(raw_ts, (int, float)):
-                        timestamp = datetime.fromtimestamp(raw_ts)
-                    elif isinstance(raw_ts, datetime):
-                        timestamp = raw_ts
-                    else:
-                        timestamp = datetime.now()
-                    exc_text = record.exception if hasattr(record, "exception") else None
-                else:
-                    # Unknown format, skip
-                    continue
-
-                # Apply filters
-                if errors_only and level_no < logging.WARNING:
-                    continue
-
-                if level_filter:
-                    target_level = level_map.get(level_filter.lower())
-                    if target_level and level_no != target_level:
-                        continue
-
-                if source_filter and source_filter not in source.lower():
-                    continue
-
-                if since and timestamp < since:
-                    continue
-
-                entry = {
-                    "timestamp": timestamp.isoformat(),
-                    "level": level_name,
-                    "source": source,
-                    "message": message,
-                }
-
-                # Add exception info if present
-                if exc_text:
-                    entry["exception"] = exc_text
-
-                entries.append(entry)
+                # Unknown format, skip
+                return entries
+
+            filters = (limit, target_level, min_level, source_filter, since_ts)
+            try:
+                # Walk the store in place; with a small limit only the tail is touched
+                entries = collect(reversed(records), *filters)
+            except RuntimeError:
+                # A record was logged mid-walk; retry on a snapshot of the store
+                entries = collect(reversed(list(records)), *filters)
 
     except Exception as err:
         _LOGGER.warning("Could not get system log entries: %s", err)
@@ -271,3 +362,154 @@ async def _get_log_entries(
         })
 
     return entries
+
+
+def _collect_log_records(
+    records: Iterable[logging.LogRecord],
+    limit: int,
+    target_level: int | None,
+    min_level: int,
+    source_filter: str | None,
+    since_ts: float | None,
+) -> list[dict[str, Any]]:
+    """Filter standard logging records, newest first.
+
+    Filters run cheapest first (level, then time, then the logger name
+    substring); the message, timestamp and exception are only formatted
+    for records that pass every filter, and the walk stops as soon as the
+    limit is reached.
+
+    Args:
+        records: Log records, newest first
+        limit: Maximum entries to return (must be positive)
+        target_level: Only keep records at exactly this level
+        min_level: Only keep records at or above this level
+        source_filter: Lowercase substring the logger name must contain
+        since_ts: Only keep records created at or after this Unix time
+
+    Returns:
+        List of log entry dictionaries
+    """
+    entries: list[dict[str, Any]] = []
+    append = entries.append
+    fromtimestamp = datetime.fromtimestamp
+
+    for record in records:
+        level_no = record.levelno
+        # An exact level implies the minimum, so only one compare is needed
+        if target_level:
+            if level_no != target_level:
+                continue
+        elif level_no < min_level:
+            continue
+
+        if since_ts and record.created < since_ts:
+            continue
+
+        source = record.name
+        if source_filter and source_filter not in source.lower():
+            continue
+
+        entry = {
+            "timestamp": fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "source": source,
+            "message": record.getMessage(),
+        }
+
+        # Add exception info if present, reusing the text cached on the
+        # record the same way logging.Formatter.format does
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            entry["exception"] = record.exc_text
+
+        append(entry)
+        if len(entries) == limit:
+            break
+
+    return entries
+
+
+def _collect_system_log_entries(
+    records: Iterable[Any],
+    limit: int,
+    target_level: int | None,
+    min_level: int,
+    source_filter: str | None,
+    since_ts: float | None,
+) -> list[dict[str, Any]]:
+    """Filter Home Assistant system_log entries, newest first.
+
+    Args:
+        records: system_log LogEntry objects, newest first
+        limit: Maximum entries to return (must be positive)
+        target_level: Only keep entries at exactly this level
+        min_level: Only keep entries at or above this level
+        source_filter: Lowercase substring the logger name must contain
+        since_ts: Only keep entries logged at or after this Unix time
+
+    Returns:
+        List of log entry dictionaries
+    """
+    entries: list[dict[str, Any]] = []
+    append = entries.append
+    fromtimestamp = datetime.fromtimestamp
+
+    for record in records:
+        level_name = record.level
+        level_no = _LEVEL_NUMBERS.get(level_name, 0)
+        # An exact level implies the minimum, so only one compare is needed
+        if target_level:
+            if level_no != target_level:
+                continue
+        elif level_no < min_level:
+            continue
+
+        # timestamp may be a float (unix timestamp) or datetime
+        raw_ts = getattr(record, "timestamp", None)
+        if isinstance(raw_ts, (int, float)):
+            ts = raw_ts
+        elif isinstance(raw_ts, datetime):
+            ts = raw_ts.timestamp()
+        else:
+            ts = time.time()
+
+        if since_ts and ts < since_ts:
+            continue
+
+        source = record.name
+        if source_filter and source_filter not in source.lower():
+            continue
+
+        # message is a deque of strings, join them; most hold a single line
+        raw_message = record.message
+        if isinstance(raw_message, str) or not hasattr(raw_message, "__iter__"):
+            message = str(raw_message)
+        elif isinstance(raw_message, Sequence) and len(raw_message) == 1:
+            message = str(raw_message[0])
+        else:
+            message = " | ".join(map(str, raw_message))
+
+        if isinstance(raw_ts, datetime):
+            timestamp = raw_ts.isoformat()
+        else:
+            timestamp = fromtimestamp(ts).isoformat()
+
+        entry = {
+            "timestamp": timestamp,
+            "level": level_name,
+            "source": source,
+            "message": message,
+        }
+
+        # Add exception info if present
+        exc_text = getattr(record, "exception", None)
+        if exc_text:
+            entry["exception"] = exc_text
+
+        append(entry)
+        if len(entries) == limit:
+            break
+
+    return entries
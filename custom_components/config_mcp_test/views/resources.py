@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Any
+from weakref import WeakSet
 
 from aiohttp import web
 
@@ -23,12 +25,56 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Resource collections already known to be loaded
+_RESOURCES_LOADED: WeakSet[Any] = WeakSet()
+
 
 def get_lovelace_data(hass: HomeAssistant):
     """Get lovelace data from hass.data."""
     return hass.data.get(LOVELACE_DATA)
 
 
+async def _async_ensure_resources_loaded(resource_collection: Any) -> None:
+    """Load a Lovelace resource collection if it has not been loaded yet.
+
+    The collection is only probed until it is known to be loaded; later
+    calls return straight away.
+
+    Args:
+        resource_collection: ResourceYAMLCollection or ResourceStorageCollection
+    """
+    if resource_collection in _RESOURCES_LOADED:
+        return
+
+    # Ensure storage collection is loaded if it has a load method
+    if hasattr(resource_collection, 'loaded') and not resource_collection.loaded:
+        if hasattr(resource_collection, 'async_load'):
+            await resource_collection.async_load()
+            resource_collection.loaded = True
+
+    _RESOURCES_LOADED.add(resource_collection)
+
+
+def _get_resource_items(resource_collection: Any) -> Iterable[dict[str, Any]]:
+    """Get the items of a Lovelace resource collection.
+
+    Storage collections keep their items in a dict and async_items() copies
+    its values into a new list on every call; the values are read directly
+    instead, so the only list built is the response itself.
+
+    Args:
+        resource_collection: ResourceYAMLCollection or ResourceStorageCollection
+
+    Returns:
+        The resource items
+    """
+    data = getattr(resource_collection, "data", None)
+    if isinstance(data, dict):
+        return data.values()
+    # async_items() is actually a synchronous method (decorated with @callback)
+    return resource_collection.async_items()
+
+
 class ResourceListView(HomeAssistantView):
     """View to list all Lovelace resources (custom cards, modules, etc.).
 
@@ -75,23 +121,18 @@ class ResourceListView(HomeAssistantView):
             # Get resources from the lovelace data
             # resources can be either ResourceYAMLCollection or ResourceStorageCollection
             resource_collection = lovelace_data.resources
+            await _async_ensure_resources_loaded(resource_collection)
 
-            # Ensure storage collection is loaded if it has a load method
-            if hasattr(resource_collection, 'loaded') and not resource_collection.loaded:
-                if hasattr(resource_collection, 'async_load'):
-                    await resource_collection.async_load()
-                    resource_collection.loaded = True
-
-            # async_items() is actually a synchronous method (decorated with @callback)
-            items = resource_collection.async_items()
+            items = _get_resource_items(resource_collection)
 
-            for item in items:
-                resource_data = {
+            resources = [
+                {
                     "id": item.get("id"),
                     "type": item.get("type"),
                     "url": item.get("url"),
                 }
-                resources.append(resource_data)
+                for item in items
+            ]
 
         except AttributeError as err:
             _LOGGER.warning(
@@ -103,13 +144,14 @@ class ResourceListView(HomeAssistantView):
                     resource_obj = lovelace_data.resources
                     if hasattr(resource_obj, 'data'):
                         # StorageCollection stores items in .data dict
-                        for item_id, item in resource_obj.data.items():
-                            resource_data = {
+                        resources = [
+                            {
                                 "id": item_id,
                                 "type": item.get("type"),
                                 "url": item.get("url"),
                             }
-                            resources.append(resource_data)
+                            for item_id, item in resource_obj.data.items()
+                        ]
                     elif hasattr(resource_obj, 'async_get_info'):
                         # Try getting info which may contain resource count
                         info = await resource_obj.async_get_info()
@@ -37,7 +37,7 @@ SCENE_DOMAIN = "scene"
 
 def get_config_options(hass: HomeAssistant) -> dict[str, Any]:
     """Get the current configuration options for config_mcp."""
-    options = DEFAULT_OPTIONS.copy()
+    options = dict(DEFAULT_OPTIONS)
 
     if DOMAIN in hass.data:
         for entry_id, entry_data in hass.data[DOMAIN].items():
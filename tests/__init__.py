@@ -0,0 +1 @@
+"""Tests for the Configuration MCP Server integration."""
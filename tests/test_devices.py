@@ -0,0 +1,64 @@
+"""Tests for the device discovery views."""
+
+from __future__ import annotations
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.config_mcp_test.views.devices import (
+    _device_integration,
+    _parse_device_filters,
+)
+
+
+def test_parse_device_filters_decodes_once() -> None:
+    """A percent-encoded percent sign stays a literal percent sign."""
+    filters = _parse_device_filters("model=100%2541&manufacturer=A%26B")
+
+    assert filters[4] == "100%41"
+    assert filters[3] == "A&B"
+
+
+def test_parse_device_filters_plus_is_space() -> None:
+    """A "+" decodes to a space, while an encoded "+" stays a plus sign."""
+    filters = _parse_device_filters("model=Hue+Go&manufacturer=C%2B%2B")
+
+    assert filters[4] == "Hue Go"
+    assert filters[3] == "C++"
+
+
+def test_parse_device_filters_first_value_wins() -> None:
+    """A repeated parameter resolves to its first value."""
+    filters = _parse_device_filters("area=kitchen&area=garage")
+
+    assert filters[0] == "kitchen"
+
+
+def test_parse_device_filters_defaults() -> None:
+    """Missing filters are None and disabled devices are excluded."""
+    assert _parse_device_filters("") == (None, None, None, None, None, False)
+    assert _parse_device_filters("include_disabled=TRUE")[5] is True
+
+
+@pytest.mark.asyncio
+async def test_device_integration_falls_back_to_config_entry(hass: HomeAssistant) -> None:
+    """Devices without identifiers resolve to their config entry's domain."""
+    entry = MockConfigEntry(domain="mqtt")
+    entry.add_to_hass(hass)
+
+    with_identifiers = dr.DeviceEntry(
+        identifiers={("hue", "bridge")},
+        config_entries={entry.entry_id},
+        primary_config_entry=entry.entry_id,
+    )
+    without_identifiers = dr.DeviceEntry(
+        config_entries={entry.entry_id},
+        primary_config_entry=entry.entry_id,
+    )
+
+    assert _device_integration(hass, with_identifiers) == "hue"
+    assert _device_integration(hass, without_identifiers) == "mqtt"
+    assert _device_integration(hass, dr.DeviceEntry()) is None
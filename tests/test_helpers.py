@@ -0,0 +1,128 @@
+"""Tests for the helper storage cache."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from custom_components.config_mcp_test.views.helpers import (
+    _async_flush_domain,
+    _async_get_data,
+    _schedule_save,
+)
+
+HELPERS = "custom_components.config_mcp_test.views.helpers"
+STORAGE_KEY = "core.input_boolean"
+
+
+def _store_items(hass_storage: dict[str, Any], *helper_ids: str) -> None:
+    """Write input_boolean helpers to the mocked storage file."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": {"items": [{"id": helper_id, "name": helper_id} for helper_id in helper_ids]},
+    }
+
+
+def _ids(data: dict[str, Any]) -> list[str]:
+    """Get the helper IDs of the storage data."""
+    return [item["id"] for item in data["items"]]
+
+
+@pytest.mark.asyncio
+async def test_failed_save_then_external_edit(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """An edit made elsewhere after a failed save is picked up, not overwritten."""
+    _store_items(hass_storage, "original")
+    mtime = 1
+
+    with patch(f"{HELPERS}._get_mtime", side_effect=lambda path: mtime):
+        data = await _async_get_data(hass, "input_boolean", for_write=True)
+        data["items"].append({"id": "ours", "name": "ours"})
+        _schedule_save(hass, "input_boolean", data)
+
+        with patch.object(Store, "async_save", side_effect=OSError("disk full")):
+            await _async_flush_domain(hass, "input_boolean")
+
+        _store_items(hass_storage, "original", "external")
+        mtime = 2
+
+        data = await _async_get_data(hass, "input_boolean", for_write=True)
+
+    assert _ids(data) == ["original", "external"]
+
+
+@pytest.mark.asyncio
+async def test_failed_save_without_external_edit(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """A failed save does not leave unsaved changes looking saved."""
+    _store_items(hass_storage, "original")
+
+    with patch(f"{HELPERS}._get_mtime", return_value=1):
+        data = await _async_get_data(hass, "input_boolean", for_write=True)
+        data["items"].append({"id": "ours", "name": "ours"})
+        _schedule_save(hass, "input_boolean", data)
+
+        with patch.object(Store, "async_save", side_effect=OSError("disk full")):
+            await _async_flush_domain(hass, "input_boolean")
+
+        data = await _async_get_data(hass, "input_boolean")
+
+    assert _ids(data) == ["original"]
+
+
+@pytest.mark.asyncio
+async def test_own_save_is_not_an_external_edit(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Saving changes the file, but the cached data is kept; later edits elsewhere are not."""
+    _store_items(hass_storage, "original")
+    mtime = 1
+    async_save = Store.async_save
+
+    async def _async_save(store: Store, data: dict[str, Any]) -> None:
+        nonlocal mtime
+        await async_save(store, data)
+        mtime += 1
+
+    with (
+        patch(f"{HELPERS}._get_mtime", side_effect=lambda path: mtime),
+        patch.object(Store, "async_save", _async_save),
+    ):
+        data = await _async_get_data(hass, "input_boolean", for_write=True)
+        data["items"].append({"id": "ours", "name": "ours"})
+        _schedule_save(hass, "input_boolean", data)
+        await _async_flush_domain(hass, "input_boolean")
+
+        assert await _async_get_data(hass, "input_boolean", for_write=True) is data
+
+        _store_items(hass_storage, "original", "ours", "external")
+        mtime += 1
+
+        data = await _async_get_data(hass, "input_boolean", for_write=True)
+
+    assert _ids(data) == ["original", "ours", "external"]
+
+
+@pytest.mark.asyncio
+async def test_reads_throttle_file_checks(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Reads check the file at most once per interval, writes always check."""
+    _store_items(hass_storage, "original")
+
+    with patch(f"{HELPERS}._get_mtime", return_value=1) as get_mtime:
+        await _async_get_data(hass, "input_boolean")
+        await _async_get_data(hass, "input_boolean")
+        assert get_mtime.call_count == 1
+
+        await _async_get_data(hass, "input_boolean", for_write=True)
+        assert get_mtime.call_count == 2